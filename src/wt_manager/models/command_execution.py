@@ -1,13 +1,19 @@
 """Command execution data model for Git Worktree Manager."""
 
-import json
-import uuid
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import islice
 from pathlib import Path
 from typing import Any
 
+from ..utils.ids import new_id
+from ..utils.serialization import dumps_json, loads_json
+
 
 class CommandStatus(Enum):
     """Status enumeration for command execution."""
@@ -20,7 +26,89 @@ class CommandStatus(Enum):
     TIMEOUT = "timeout"
 
 
-@dataclass
+# Direct value -> member lookup; calling CommandStatus(value) is much slower
+_COMMAND_STATUS_BY_VALUE = {status.value: status for status in CommandStatus}
+
+
+_FINISHED_STATUSES = frozenset(
+    {
+        CommandStatus.COMPLETED,
+        CommandStatus.FAILED,
+        CommandStatus.CANCELLED,
+        CommandStatus.TIMEOUT,
+    }
+)
+
+
+def _ns_to_timedelta(nanoseconds: int) -> timedelta:
+    """Convert a nanosecond interval to a timedelta."""
+    return timedelta(microseconds=nanoseconds // 1000)
+
+
+def _timedelta_to_ns(interval: timedelta) -> int:
+    """Convert a timedelta to a nanosecond interval."""
+    return interval // timedelta(microseconds=1) * 1000
+
+
+def _truncate_command(command: str, max_length: int) -> str:
+    """Truncate a command to max_length characters, ending with an ellipsis."""
+    return command[: max_length - 3] + "..."
+
+
+class _OutputBuffer:
+    """
+    Thread-safe text buffer with O(1) appends and a cached joined value.
+
+    Appended chunks are joined into the cached text on the next read, so
+    repeated reads without new output return the cached string directly.
+    """
+
+    __slots__ = ("_chunks", "_lock", "_text")
+
+    def __init__(self, text: str = ""):
+        self._chunks: list[str] = []
+        self._lock = threading.Lock()
+        self._text = text
+
+    def append(self, data: str) -> None:
+        """Queue data to be added to the text on the next read."""
+        with self._lock:
+            self._chunks.append(data)
+
+    def getvalue(self) -> str:
+        """Return the full text, joining any pending chunks into the cache."""
+        with self._lock:
+            if self._chunks:
+                self._text = "".join([self._text, *self._chunks])
+                self._chunks.clear()
+            return self._text
+
+
+class _ChunkedText:
+    """
+    Dataclass field descriptor backed by a per-instance _OutputBuffer.
+
+    Appending is O(1) instead of copying the whole string each time; the
+    joined text is cached and only rebuilt after new output arrives.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._buffer_name = f"_{name}_buffer"
+
+    def __get__(self, instance, owner=None) -> str:
+        if instance is None:
+            # Class-level value doubles as the dataclass field default
+            return ""
+
+        return instance.__dict__[self._buffer_name].getvalue()
+
+    def __set__(self, instance, value: str) -> None:
+        instance.__dict__[self._buffer_name] = _OutputBuffer(value)
+
+
+# Not slotted: the _ChunkedText descriptors keep their buffers in the
+# instance __dict__, and a dataclass slot would replace the descriptor
+@dataclass(eq=False)
 class CommandExecution:
     """
     Represents a command execution with its status, output, and metadata.
@@ -45,21 +133,32 @@ class CommandExecution:
     start_time: datetime
     end_time: datetime | None = None
     exit_code: int | None = None
-    stdout: str = ""
-    stderr: str = ""
+    stdout: str = _ChunkedText()
+    stderr: str = _ChunkedText()
     status: CommandStatus = CommandStatus.PENDING
     timeout_seconds: int | None = None
     process_id: int | None = None
+    # Monotonic clock readings (ns) for start_time and for when the command
+    # finished, so durations are immune to wall-clock adjustments
+    _start_ns: int = field(default=0, init=False, repr=False, compare=False)
+    _ended_ns: int | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Post-initialization validation and setup."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = new_id()
 
         # Ensure we have a valid start time
         if not self.start_time:
             self.start_time = datetime.now()
 
+        # Anchor start_time on the monotonic clock; durations count from it,
+        # including any time spent queued before mark_started(). Reading now
+        # in start_time's own timezone keeps aware timestamps comparable.
+        self._start_ns = time.monotonic_ns() - _timedelta_to_ns(
+            datetime.now(self.start_time.tzinfo) - self.start_time
+        )
+
     def is_running(self) -> bool:
         """
         Check if the command is currently running.
@@ -67,7 +166,7 @@ class CommandExecution:
         Returns:
             bool: True if command is running, False otherwise
         """
-        return self.status == CommandStatus.RUNNING
+        return self.status is CommandStatus.RUNNING
 
     def is_finished(self) -> bool:
         """
@@ -76,12 +175,7 @@ class CommandExecution:
         Returns:
             bool: True if command has finished, False otherwise
         """
-        return self.status in {
-            CommandStatus.COMPLETED,
-            CommandStatus.FAILED,
-            CommandStatus.CANCELLED,
-            CommandStatus.TIMEOUT,
-        }
+        return self.status in _FINISHED_STATUSES
 
     def is_successful(self) -> bool:
         """
@@ -90,21 +184,28 @@ class CommandExecution:
         Returns:
             bool: True if command completed with exit code 0, False otherwise
         """
-        return self.status == CommandStatus.COMPLETED and self.exit_code == 0
+        return self.status is CommandStatus.COMPLETED and self.exit_code == 0
 
     def get_duration(self) -> timedelta | None:
         """
         Calculate the duration of command execution.
 
+        Durations count from start_time, so time spent queued before
+        mark_started() is included. They are measured on the monotonic clock
+        unless the command finished before this instance was created (e.g.
+        loaded from history), in which case the recorded timestamps are used.
+
         Returns:
             Optional[timedelta]: Duration if command has ended, None if still running
         """
         if not self.end_time:
             if self.is_running():
                 # Return current duration for running commands
-                return datetime.now() - self.start_time
+                return _ns_to_timedelta(time.monotonic_ns() - self._start_ns)
             return None
 
+        if self._ended_ns is not None:
+            return _ns_to_timedelta(self._ended_ns - self._start_ns)
         return self.end_time - self.start_time
 
     def get_duration_display(self) -> str:
@@ -195,10 +296,11 @@ class CommandExecution:
         Returns:
             str: Truncated command string
         """
-        if len(self.command) <= max_length:
-            return self.command
+        command = self.command
+        if len(command) <= max_length:
+            return command
 
-        return self.command[: max_length - 3] + "..."
+        return _truncate_command(command, max_length)
 
     def append_stdout(self, data: str) -> None:
         """
@@ -207,7 +309,7 @@ class CommandExecution:
         Args:
             data: Data to append to stdout
         """
-        self.stdout += data
+        self._stdout_buffer.append(data)
 
     def append_stderr(self, data: str) -> None:
         """
@@ -216,7 +318,7 @@ class CommandExecution:
         Args:
             data: Data to append to stderr
         """
-        self.stderr += data
+        self._stderr_buffer.append(data)
 
     def mark_started(self, process_id: int | None = None) -> None:
         """
@@ -237,25 +339,24 @@ class CommandExecution:
         Args:
             exit_code: Exit code returned by the command
         """
-        self.end_time = datetime.now()
         self.exit_code = exit_code
-        self.process_id = None
-
-        if exit_code == 0:
-            self.status = CommandStatus.COMPLETED
-        else:
-            self.status = CommandStatus.FAILED
+        self._mark_finished(
+            CommandStatus.COMPLETED if exit_code == 0 else CommandStatus.FAILED
+        )
 
     def mark_cancelled(self) -> None:
         """Mark the command as cancelled."""
-        self.end_time = datetime.now()
-        self.status = CommandStatus.CANCELLED
-        self.process_id = None
+        self._mark_finished(CommandStatus.CANCELLED)
 
     def mark_timeout(self) -> None:
         """Mark the command as timed out."""
+        self._mark_finished(CommandStatus.TIMEOUT)
+
+    def _mark_finished(self, status: CommandStatus) -> None:
+        """Record the end of the command with the given terminal status."""
+        self._ended_ns = time.monotonic_ns()
         self.end_time = datetime.now()
-        self.status = CommandStatus.TIMEOUT
+        self.status = status
         self.process_id = None
 
     def is_timed_out(self) -> bool:
@@ -281,8 +382,6 @@ class CommandExecution:
         Returns:
             str: Worktree directory name
         """
-        from pathlib import Path
-
         return Path(self.worktree_path).name
 
     def to_dict(self) -> dict[str, Any]:
@@ -330,7 +429,8 @@ class CommandExecution:
             exit_code=data.get("exit_code"),
             stdout=data.get("stdout", ""),
             stderr=data.get("stderr", ""),
-            status=CommandStatus(data["status"]),
+            status=_COMMAND_STATUS_BY_VALUE.get(data["status"])
+            or CommandStatus(data["status"]),
             timeout_seconds=data.get("timeout_seconds"),
             process_id=data.get("process_id"),
         )
@@ -342,7 +442,7 @@ class CommandExecution:
         Returns:
             str: JSON representation of the command execution
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps_json(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> "CommandExecution":
@@ -355,7 +455,7 @@ class CommandExecution:
         Returns:
             CommandExecution: Deserialized command execution instance
         """
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         return cls.from_dict(data)
 
     def __eq__(self, other) -> bool:
@@ -380,20 +480,63 @@ class CommandExecution:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandHistory:
     """
     Manages command execution history for a specific worktree or globally.
 
     Attributes:
         worktree_path: Path to the worktree (None for global history)
-        executions: List of command executions
+        executions: Bounded deque of command executions, most recent first
         max_history_size: Maximum number of executions to keep in history
     """
 
     worktree_path: str | None = None
-    executions: list[CommandExecution] = field(default_factory=list)
+    executions: deque[CommandExecution] = field(default_factory=deque)
     max_history_size: int = 100
+    _executions_by_id: dict[str, CommandExecution] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _executions_by_command: dict[str, deque[CommandExecution]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """Post-initialization setup."""
+        # Keep the most recent executions; the deque drops the oldest on overflow
+        self.executions = deque(
+            islice(self.executions, self.max_history_size),
+            maxlen=self.max_history_size,
+        )
+        self._rebuild_indexes()
+
+    def _rebuild_indexes(self) -> None:
+        """Rebuild the id and command lookup tables from the executions."""
+        self._executions_by_id.clear()
+        self._executions_by_command.clear()
+        for execution in reversed(self.executions):
+            self._index_execution(execution)
+
+    def _index_execution(self, execution: CommandExecution) -> None:
+        """Register the newest execution in the lookup tables."""
+        self._executions_by_id[execution.id] = execution
+        same_command = self._executions_by_command.setdefault(
+            execution.command, deque()
+        )
+        same_command.appendleft(execution)
+
+    def _unindex_execution(self, execution: CommandExecution) -> None:
+        """Drop an execution that left the history from the lookup tables."""
+        if self._executions_by_id.get(execution.id) is execution:
+            del self._executions_by_id[execution.id]
+
+        same_command = self._executions_by_command[execution.command]
+        for i, candidate in enumerate(same_command):
+            if candidate is execution:
+                del same_command[i]
+                break
+        if not same_command:
+            del self._executions_by_command[execution.command]
 
     def add_execution(self, execution: CommandExecution) -> None:
         """
@@ -402,12 +545,16 @@ class CommandHistory:
         Args:
             execution: CommandExecution instance to add
         """
-        # Add to the beginning of the list (most recent first)
-        self.executions.insert(0, execution)
+        if self.executions.maxlen == 0:
+            return
+
+        # The deque evicts the oldest entry itself; keep the indexes in step
+        if len(self.executions) == self.executions.maxlen:
+            self._unindex_execution(self.executions[-1])
 
-        # Trim history if it exceeds max size
-        if len(self.executions) > self.max_history_size:
-            self.executions = self.executions[: self.max_history_size]
+        # Add to the front (most recent first); maxlen trims the oldest entry
+        self.executions.appendleft(execution)
+        self._index_execution(execution)
 
     def get_recent_executions(self, limit: int = 10) -> list[CommandExecution]:
         """
@@ -419,7 +566,7 @@ class CommandHistory:
         Returns:
             List[CommandExecution]: Most recent executions
         """
-        return self.executions[:limit]
+        return list(islice(self.executions, limit))
 
     def get_running_executions(self) -> list[CommandExecution]:
         """
@@ -440,10 +587,7 @@ class CommandHistory:
         Returns:
             Optional[CommandExecution]: Execution if found, None otherwise
         """
-        for execution in self.executions:
-            if execution.id == execution_id:
-                return execution
-        return None
+        return self._executions_by_id.get(execution_id)
 
     def get_executions_by_command(self, command: str) -> list[CommandExecution]:
         """
@@ -455,7 +599,7 @@ class CommandHistory:
         Returns:
             List[CommandExecution]: Executions matching the command
         """
-        return [exec for exec in self.executions if exec.command == command]
+        return list(self._executions_by_command.get(command, ()))
 
     def get_successful_executions(self) -> list[CommandExecution]:
         """
@@ -478,6 +622,23 @@ class CommandHistory:
     def clear_history(self) -> None:
         """Clear all command execution history."""
         self.executions.clear()
+        self._rebuild_indexes()
+
+    def prune_executions(self, keep: Callable[[CommandExecution], bool]) -> int:
+        """
+        Remove every execution for which the predicate returns False.
+
+        Args:
+            keep: Predicate returning True for executions to retain
+
+        Returns:
+            int: Number of executions removed
+        """
+        original_count = len(self.executions)
+        retained = [execution for execution in self.executions if keep(execution)]
+        self.executions = deque(retained, maxlen=self.max_history_size)
+        self._rebuild_indexes()
+        return original_count - len(self.executions)
 
     def remove_execution(self, execution_id: str) -> bool:
         """
@@ -489,11 +650,22 @@ class CommandHistory:
         Returns:
             bool: True if execution was found and removed, False otherwise
         """
-        for i, execution in enumerate(self.executions):
-            if execution.id == execution_id:
+        execution = self._executions_by_id.get(execution_id)
+        if execution is None:
+            return False
+
+        for i, candidate in enumerate(self.executions):
+            if candidate is execution:
                 del self.executions[i]
-                return True
-        return False
+                break
+        self._unindex_execution(execution)
+
+        # Fall back to an older execution that reused the same ID, if any
+        for candidate in self.executions:
+            if candidate.id == execution_id:
+                self._executions_by_id[execution_id] = candidate
+                break
+        return True
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -512,27 +684,30 @@ class CommandHistory:
                 "average_duration": None,
             }
 
-        status_counts = {}
-        durations = []
+        status_counts = Counter()
+        duration_total = 0.0
+        duration_count = 0
 
+        # Single pass: count statuses and accumulate finished durations
         for execution in self.executions:
-            status = execution.status.value
-            status_counts[status] = status_counts.get(status, 0) + 1
+            status = execution.status
+            status_counts[status] += 1
 
-            if execution.is_finished():
+            if status in _FINISHED_STATUSES:
                 duration = execution.get_duration()
                 if duration:
-                    durations.append(duration.total_seconds())
+                    duration_total += duration.total_seconds()
+                    duration_count += 1
 
-        avg_duration = sum(durations) / len(durations) if durations else None
+        avg_duration = duration_total / duration_count if duration_count else None
 
         return {
             "total_executions": len(self.executions),
-            "successful": status_counts.get("completed", 0),
-            "failed": status_counts.get("failed", 0),
-            "cancelled": status_counts.get("cancelled", 0),
-            "running": status_counts.get("running", 0),
-            "timeout": status_counts.get("timeout", 0),
+            "successful": status_counts[CommandStatus.COMPLETED],
+            "failed": status_counts[CommandStatus.FAILED],
+            "cancelled": status_counts[CommandStatus.CANCELLED],
+            "running": status_counts[CommandStatus.RUNNING],
+            "timeout": status_counts[CommandStatus.TIMEOUT],
             "average_duration": avg_duration,
         }
 
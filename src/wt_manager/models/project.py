@@ -1,14 +1,16 @@
 """Project data model for Git Worktree Manager."""
 
-import json
-import uuid
+import os
+import stat
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
-from .worktree import Worktree
+from ..utils.ids import new_id
+from ..utils.serialization import dumps_json, loads_json
+from .worktree import Worktree, normalize_path
 
 
 class ProjectStatus(Enum):
@@ -21,7 +23,11 @@ class ProjectStatus(Enum):
     UNAVAILABLE = "unavailable"
 
 
-@dataclass
+# Direct value -> member lookup; calling ProjectStatus(value) is much slower
+_PROJECT_STATUS_BY_VALUE = {status.value: status for status in ProjectStatus}
+
+
+@dataclass(slots=True, eq=False)
 class Project:
     """
     Represents a Git project with its associated worktrees.
@@ -41,14 +47,16 @@ class Project:
     status: ProjectStatus
     last_accessed: datetime
     worktrees: list[Worktree] = field(default_factory=list)
+    _dir_name: str = field(default="", init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Post-initialization validation and setup."""
         if not self.id:
-            self.id = str(uuid.uuid4())
+            self.id = new_id()
 
         # Ensure path is absolute and normalized
-        self.path = str(Path(self.path).resolve())
+        self.path = normalize_path(self.path)
+        self._dir_name = os.path.basename(self.path)
 
         # Validate the project on creation
         if not self._validate_basic_structure():
@@ -61,7 +69,14 @@ class Project:
         Returns:
             bool: True if project is valid, False otherwise
         """
-        return self._validate_basic_structure() and self._validate_git_repository()
+        if not self.name or not self.path:
+            return False
+
+        try:
+            path_stat = os.stat(self.path)
+        except OSError:
+            return False
+        return stat.S_ISDIR(path_stat.st_mode) and self._validate_git_repository()
 
     def _validate_basic_structure(self) -> bool:
         """Validate basic project structure."""
@@ -83,9 +98,7 @@ class Project:
         Returns:
             str: Display name, falls back to directory name if name is empty
         """
-        if self.name:
-            return self.name
-        return Path(self.path).name
+        return self.name or self._dir_name
 
     def refresh_worktrees(self) -> None:
         """
@@ -172,7 +185,8 @@ class Project:
             id=data["id"],
             name=data["name"],
             path=data["path"],
-            status=ProjectStatus(data["status"]),
+            status=_PROJECT_STATUS_BY_VALUE.get(data["status"])
+            or ProjectStatus(data["status"]),
             last_accessed=datetime.fromisoformat(data["last_accessed"]),
             worktrees=worktrees,
         )
@@ -184,7 +198,7 @@ class Project:
         Returns:
             str: JSON representation of the project
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps_json(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> "Project":
@@ -197,11 +211,13 @@ class Project:
         Returns:
             Project: Deserialized project instance
         """
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         return cls.from_dict(data)
 
     def __eq__(self, other) -> bool:
         """Check equality based on project ID."""
+        if self is other:
+            return True
         if not isinstance(other, Project):
             return False
         return self.id == other.id
@@ -1,12 +1,86 @@
 """Worktree data model for Git Worktree Manager."""
 
-import json
 import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from ..utils.serialization import dumps_json, loads_json
+
+
+@lru_cache(maxsize=4096)
+def _resolve_absolute_path(path: str) -> str:
+    """Resolve an absolute path, memoizing the filesystem lookups."""
+    # Same result as Path(path).resolve(), without building Path objects.
+    # Symlinks must still be resolved, so there is no lexical fast path.
+    return os.path.realpath(path)
+
+
+def normalize_path(path: str) -> str:
+    """
+    Resolve a path to its absolute, normalized string form.
+
+    Results are memoized because models are created repeatedly for the same
+    paths and resolving symlinks performs a filesystem lookup per component.
+    Relative paths are anchored to the current directory before the cache
+    lookup so a change of working directory never returns a stale result.
+
+    Args:
+        path: Path string to normalize
+
+    Returns:
+        str: Absolute, resolved path string
+    """
+    path = os.fspath(path)
+    if not os.path.isabs(path):
+        path = os.path.join(os.getcwd(), path)
+    return _resolve_absolute_path(path)
+
+
+def clear_path_cache() -> None:
+    """
+    Forget memoized path resolutions.
+
+    Call this after changing symlinks or directories that models may
+    already have resolved, so later lookups hit the filesystem again.
+    """
+    _resolve_absolute_path.cache_clear()
+
+
+class _LazyResolvedPath:
+    """
+    Dataclass field descriptor that stores a raw path and resolves it lazily.
+
+    Normalization is deferred until the attribute is first read, so models
+    created and discarded in bulk never pay for `normalize_path()`.
+    """
+
+    def __set_name__(self, owner, name: str) -> None:
+        self._raw_name = f"_{name}_raw"
+        self._resolved_name = f"_{name}_resolved"
+
+    def __get__(self, instance, owner=None) -> str:
+        if instance is None:
+            # No class-level default, so the dataclass field stays required
+            raise AttributeError(self._raw_name)
+
+        values = instance.__dict__
+        resolved = values[self._resolved_name]
+        if resolved is None:
+            resolved = normalize_path(values[self._raw_name])
+            values[self._resolved_name] = resolved
+        return resolved
+
+    def __set__(self, instance, value: str) -> None:
+        raw_path = os.fspath(value)
+        if not os.path.isabs(raw_path):
+            # Anchor relative paths now, as resolution happens later
+            raw_path = os.path.join(os.getcwd(), raw_path)
+        instance.__dict__[self._raw_name] = raw_path
+        instance.__dict__[self._resolved_name] = None
+
 
 @dataclass
 class Worktree:
@@ -23,7 +97,7 @@ class Worktree:
         last_modified: Timestamp of last modification
     """
 
-    path: str
+    path: str = _LazyResolvedPath()
     branch: str
     commit_hash: str
     is_bare: bool = False
@@ -33,9 +107,7 @@ class Worktree:
 
     def __post_init__(self):
         """Post-initialization setup."""
-        # Ensure path is absolute and normalized
-        self.path = str(Path(self.path).resolve())
-
+        # The path is normalized on first access (see _LazyResolvedPath)
         # Set default last_modified if not provided
         if self.last_modified is None:
             self.last_modified = datetime.now()
@@ -108,7 +180,8 @@ class Worktree:
         Returns:
             str: Directory name
         """
-        return Path(self.path).name
+        # The path is already resolved, so no trailing separator to strip
+        return os.path.basename(self.path)
 
     def exists(self) -> bool:
         """
@@ -224,7 +297,7 @@ class Worktree:
         Returns:
             str: JSON representation of the worktree
         """
-        return json.dumps(self.to_dict(), indent=2)
+        return dumps_json(self.to_dict())
 
     @classmethod
     def from_json(cls, json_str: str) -> "Worktree":
@@ -237,13 +310,18 @@ class Worktree:
         Returns:
             Worktree: Deserialized worktree instance
         """
-        data = json.loads(json_str)
+        data = loads_json(json_str)
         return cls.from_dict(data)
 
     def __eq__(self, other) -> bool:
         """Check equality based on worktree path."""
+        if self is other:
+            return True
         if not isinstance(other, Worktree):
             return False
+        # Identical raw paths resolve identically, so skip normalization
+        if self._path_raw == other._path_raw:
+            return True
         return self.path == other.path
 
     def __hash__(self) -> int:
@@ -1,15 +1,20 @@
 """Command execution manager for advanced state management and persistence."""
 
-import json
 import logging
 import threading
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
+import msgpack
+
 from ..models.command_execution import CommandExecution, CommandHistory, CommandStatus
 from ..services.base import ServiceError
 from ..utils.path_manager import PathManager
+from ..utils.serialization import loads_json
+
+STATE_FILE_NAME = "command_state.msgpack"
+LEGACY_STATE_FILE_NAME = "command_state.json"
 
 
 class CommandExecutionState:
@@ -46,7 +51,7 @@ class CommandExecutionState:
         if persist_state:
             try:
                 config_dir = PathManager.get_config_dir()
-                self._state_file = config_dir / "command_state.json"
+                self._state_file = config_dir / STATE_FILE_NAME
                 self._load_state()
             except Exception as e:
                 self._logger.warning(f"Failed to initialize state persistence: {e}")
@@ -216,23 +221,16 @@ class CommandExecutionState:
         """
         cutoff_time = datetime.now() - timedelta(hours=older_than_hours)
 
+        def should_keep(execution: CommandExecution) -> bool:
+            return execution.start_time > cutoff_time or execution.is_running()
+
         with self._lock:
             # Clean global history (this is the authoritative count)
-            original_count = len(self._global_history.executions)
-            self._global_history.executions = [
-                exec
-                for exec in self._global_history.executions
-                if exec.start_time > cutoff_time or exec.is_running()
-            ]
-            cleaned_count = original_count - len(self._global_history.executions)
+            cleaned_count = self._global_history.prune_executions(should_keep)
 
             # Clean worktree histories (don't count these separately)
             for history in self._execution_history.values():
-                history.executions = [
-                    exec
-                    for exec in history.executions
-                    if exec.start_time > cutoff_time or exec.is_running()
-                ]
+                history.prune_executions(should_keep)
 
         if cleaned_count > 0:
             self._logger.info(f"Cleaned up {cleaned_count} old executions")
@@ -284,8 +282,8 @@ class CommandExecutionState:
             self._state_file.parent.mkdir(parents=True, exist_ok=True)
 
             # Write state to file
-            with open(self._state_file, "w", encoding="utf-8") as f:
-                json.dump(state_data, f, indent=2)
+            with open(self._state_file, "wb") as f:
+                f.write(msgpack.packb(state_data, use_bin_type=True))
 
             self._logger.debug(f"Saved command state to {self._state_file}")
 
@@ -293,13 +291,21 @@ class CommandExecutionState:
             self._logger.error(f"Failed to save command state: {e}")
 
     def _load_state(self) -> None:
-        """Load state from disk."""
-        if not self._state_file or not self._state_file.exists():
+        """Load state from disk, migrating a legacy JSON state file if present."""
+        if not self._state_file:
+            return
+
+        legacy_file = self._state_file.with_name(LEGACY_STATE_FILE_NAME)
+        migrate = not self._state_file.exists() and legacy_file.exists()
+        if not migrate and not self._state_file.exists():
             return
 
         try:
-            with open(self._state_file, encoding="utf-8") as f:
-                state_data = json.load(f)
+            if migrate:
+                state_data = loads_json(legacy_file.read_bytes())
+            else:
+                with open(self._state_file, "rb") as f:
+                    state_data = msgpack.unpackb(f.read(), raw=False)
 
             with self._lock:
                 # Load statistics
@@ -320,10 +326,15 @@ class CommandExecutionState:
                         history_data
                     )
 
-            self._logger.info(f"Loaded command state from {self._state_file}")
-
         except Exception as e:
             self._logger.error(f"Failed to load command state: {e}")
+            return
+
+        if migrate:
+            self.save_state()
+            self._logger.info(f"Migrated command state from {legacy_file}")
+        else:
+            self._logger.info(f"Loaded command state from {self._state_file}")
 
 
 class CommandManager:
@@ -6,7 +6,6 @@ import signal
 import subprocess
 import threading
 import time
-import uuid
 from pathlib import Path
 from typing import Any
 from collections.abc import Callable
@@ -17,6 +16,7 @@ from ..models.command_execution import CommandExecution
 from ..services.base import CommandServiceInterface, ValidationResult
 from ..services.validation_service import ValidationService
 from ..services.command_manager import get_command_manager
+from ..utils.ids import new_id
 
 
 class CommandExecutionWorker(QThread):
@@ -281,7 +281,7 @@ class CommandService(CommandServiceInterface):
 
         # Create execution instance
         execution = CommandExecution(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             command=command,
             worktree_path=worktree_path,
             start_time=None,  # Will be set when execution starts
@@ -1,12 +1,13 @@
 """Project management service for Git Worktree Manager."""
 
 import logging
-import uuid
 from datetime import datetime
 from pathlib import Path
 
 from ..models.project import Project, ProjectStatus
+from ..models.worktree import clear_path_cache
 from ..utils.exceptions import ServiceError, ValidationError
+from ..utils.ids import new_id
 from .base import ProjectServiceInterface, ValidationResult
 from .config_manager import ConfigManager
 from .git_service import GitService
@@ -196,6 +197,9 @@ class ProjectService(ProjectServiceInterface):
 
             project = self._projects_cache[project_id]
 
+            # Re-resolve paths in case directories or symlinks changed on disk
+            clear_path_cache()
+
             # Update project status and information
             updated_project = self._refresh_project_status(project)
 
@@ -354,7 +358,7 @@ class ProjectService(ProjectServiceInterface):
         project_name = path_obj.name
 
         return Project(
-            id=str(uuid.uuid4()),
+            id=new_id(),
             name=project_name,
             path=path,
             status=ProjectStatus.ACTIVE,
@@ -5,7 +5,7 @@ from datetime import datetime
 from pathlib import Path
 
 from ..models.project import Project
-from ..models.worktree import Worktree
+from ..models.worktree import Worktree, clear_path_cache
 from ..utils.exceptions import GitError, ServiceError, ValidationError
 from .base import ValidationResult, WorktreeServiceInterface
 from .git_service import GitService
@@ -155,6 +155,8 @@ class WorktreeService(WorktreeServiceInterface):
             )
             if not result.success:
                 raise ServiceError(f"Failed to create worktree: {result.error}")
+            # The new directory can change how cached paths resolve
+            clear_path_cache()
 
             # Create Worktree object
             worktree = Worktree(
@@ -222,6 +224,7 @@ class WorktreeService(WorktreeServiceInterface):
             result = self._git_service.remove_worktree(worktree.path, force)
             if not result.success:
                 raise ServiceError(f"Failed to remove worktree: {result.error}")
+            clear_path_cache()
 
             logger.info(f"Removed worktree at {worktree.path}")
             return True
@@ -306,6 +309,8 @@ class WorktreeService(WorktreeServiceInterface):
             List[Worktree]: List of refreshed worktrees
         """
         try:
+            # Re-resolve paths in case worktrees or symlinks changed on disk
+            clear_path_cache()
             return self.get_worktrees(project)
 
         except Exception as e:
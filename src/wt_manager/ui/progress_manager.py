@@ -1,7 +1,7 @@
 """Progress feedback and status management system."""
 
 from PyQt6.QtWidgets import QProgressDialog, QWidget, QStatusBar
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, QTimer
 
 from ..utils.exceptions import GitWorktreeManagerError
 from .error_dialogs import show_success_notification
@@ -15,6 +15,9 @@ class OperationProgress(QObject):
     completed = pyqtSignal(bool)  # True for success, False for failure
     error_occurred = pyqtSignal(GitWorktreeManagerError)
 
+    # Minimum interval between progress signal emissions (~60 Hz)
+    EMIT_INTERVAL_MS = 16
+
     def __init__(self, operation_id: str, description: str):
         super().__init__()
         self.operation_id = operation_id
@@ -24,24 +27,52 @@ class OperationProgress(QObject):
         self.is_completed = False
         self.is_cancelled = False
 
+        # Updates arriving while the emit timer runs are coalesced into one
+        self._last_emitted_progress = -1
+        self._last_emitted_status = self.status
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EMIT_INTERVAL_MS)
+        self._emit_timer.timeout.connect(self._do_emit)
+
     def update_progress(self, progress: int, status: str = None):
         """Update progress and optionally status."""
-        self.progress = max(0, min(100, progress))
+        progress = max(0, min(100, progress))
+        if progress == self.progress and (not status or status == self.status):
+            return
+
+        self.progress = progress
         if status:
             self.status = status
 
-        self.progress_changed.emit(self.progress)
-        if status:
+        if not self._emit_timer.isActive():
+            self._do_emit()
+
+    def _do_emit(self):
+        """Emit progress and status if they changed since the last emission."""
+        emitted = False
+        if self.progress != self._last_emitted_progress:
+            self._last_emitted_progress = self.progress
+            self.progress_changed.emit(self.progress)
+            emitted = True
+        if self.status != self._last_emitted_status:
+            self._last_emitted_status = self.status
             self.status_changed.emit(self.status)
+            emitted = True
+
+        if emitted:
+            self._emit_timer.start()
 
     def update_status(self, status: str):
         """Update status message."""
         self.status = status
+        self._last_emitted_status = status
         self.status_changed.emit(status)
 
     def complete_success(self, message: str = None):
         """Mark operation as successfully completed."""
         if not self.is_completed:
+            self._emit_timer.stop()
             self.progress = 100
             self.status = message or "Completed successfully"
             self.is_completed = True
@@ -52,6 +83,7 @@ class OperationProgress(QObject):
     def complete_error(self, error: GitWorktreeManagerError):
         """Mark operation as failed with error."""
         if not self.is_completed:
+            self._emit_timer.stop()
             self.is_completed = True
             # Handle both GitWorktreeManagerError and generic exceptions
             if hasattr(error, "user_message"):
@@ -65,6 +97,7 @@ class OperationProgress(QObject):
     def cancel(self):
         """Cancel the operation."""
         if not self.is_completed:
+            self._emit_timer.stop()
             self.is_cancelled = True
             self.is_completed = True
             self.status = "Cancelled"
@@ -122,23 +155,60 @@ class ProgressDialog(QProgressDialog):
 class StatusBarManager(QObject):
     """Manages status bar updates and temporary messages."""
 
+    # Minimum interval between status bar repaints (~60 Hz)
+    FLUSH_INTERVAL_MS = 16
+
+    # Icon prefixes for the typed message helpers
+    SUCCESS_PREFIX = "✅ "
+    WARNING_PREFIX = "⚠️ "
+    ERROR_PREFIX = "❌ "
+    INFO_PREFIX = "ℹ️ "
+
     def __init__(self, status_bar: QStatusBar):
         super().__init__()
         self.status_bar = status_bar
-        self._temp_timer = QTimer()
+        self._temp_timer = QTimer(self)
+        self._temp_timer.setSingleShot(True)
         self._temp_timer.timeout.connect(self._clear_temp_message)
         self._permanent_message = ""
         self._temp_message = ""
 
+        # Messages arriving while the flush timer runs are coalesced into one
+        self._pending: tuple[str, int] | None = None
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+
     def show_message(self, message: str, timeout: int = 0):
         """Show a message in the status bar."""
         if timeout > 0:
             self._temp_message = message
-            self.status_bar.showMessage(message, timeout)
-            self._temp_timer.start(timeout)
         else:
             self._permanent_message = message
-            self.status_bar.showMessage(message)
+
+        if self._flush_timer.isActive():
+            self._pending = (message, timeout)
+        else:
+            self._display(message, timeout)
+            self._flush_timer.start()
+
+    def _display(self, message: str, timeout: int):
+        """Write a message to the status bar."""
+        # Temporary messages expire through _temp_timer rather than
+        # QStatusBar's own timeout, so only one timer runs per message
+        self.status_bar.showMessage(message)
+        if timeout > 0:
+            self._temp_timer.start(timeout)
+
+    def _flush(self):
+        """Show the latest message queued during the last flush interval."""
+        if self._pending is not None:
+            message, timeout = self._pending
+            self._pending = None
+            self._display(message, timeout)
+            self._flush_timer.start()
 
     def show_temporary_message(self, message: str, duration: int = 3000):
         """Show a temporary message that auto-clears."""
@@ -146,29 +216,30 @@ class StatusBarManager(QObject):
 
     def show_success(self, message: str, duration: int = 3000):
         """Show a success message with icon."""
-        self.show_temporary_message(f"✅ {message}", duration)
+        self.show_temporary_message(self.SUCCESS_PREFIX + message, duration)
 
     def show_warning(self, message: str, duration: int = 5000):
         """Show a warning message with icon."""
-        self.show_temporary_message(f"⚠️ {message}", duration)
+        self.show_temporary_message(self.WARNING_PREFIX + message, duration)
 
     def show_error(self, message: str, duration: int = 5000):
         """Show an error message with icon."""
-        self.show_temporary_message(f"❌ {message}", duration)
+        self.show_temporary_message(self.ERROR_PREFIX + message, duration)
 
     def show_info(self, message: str, duration: int = 3000):
         """Show an info message with icon."""
-        self.show_temporary_message(f"ℹ️ {message}", duration)
+        self.show_temporary_message(self.INFO_PREFIX + message, duration)
 
     def clear_message(self):
         """Clear the status bar message."""
+        self._flush_timer.stop()
+        self._pending = None
         self.status_bar.clearMessage()
         self._permanent_message = ""
         self._temp_message = ""
 
     def _clear_temp_message(self):
         """Clear temporary message and restore permanent one."""
-        self._temp_timer.stop()
         if self._permanent_message:
             self.status_bar.showMessage(self._permanent_message)
         else:
@@ -179,13 +250,17 @@ class StatusBarManager(QObject):
 class ProgressManager(QObject):
     """Central manager for all progress operations."""
 
-    operation_started = pyqtSignal(str, str)  # operation_id, description
-    operation_completed = pyqtSignal(str, bool)  # operation_id, success
+    # operation_id, description, OperationProgress
+    operation_started = pyqtSignal(str, str, object)
+    # operation_id, success, OperationProgress
+    operation_completed = pyqtSignal(str, bool, object)
 
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self.parent_widget = parent
-        self._operations: dict[str, OperationProgress] = {}
+        # Operations move from active to completed when they finish
+        self._active_operations: dict[str, OperationProgress] = {}
+        self._completed_operations: dict[str, OperationProgress] = {}
         self._dialogs: dict[str, ProgressDialog] = {}
         self.status_manager: StatusBarManager | None = None
 
@@ -203,7 +278,8 @@ class ProgressManager(QObject):
         """Start a new operation with progress tracking."""
         # Create operation
         operation = OperationProgress(operation_id, description)
-        self._operations[operation_id] = operation
+        self._completed_operations.pop(operation_id, None)
+        self._active_operations[operation_id] = operation
 
         # Connect completion signal
         operation.completed.connect(
@@ -221,13 +297,16 @@ class ProgressManager(QObject):
             self.status_manager.show_info(f"Starting: {description}")
 
         # Emit signal
-        self.operation_started.emit(operation_id, description)
+        self.operation_started.emit(operation_id, description, operation)
 
         return operation
 
     def get_operation(self, operation_id: str) -> OperationProgress | None:
         """Get an existing operation by ID."""
-        return self._operations.get(operation_id)
+        operation = self._active_operations.get(operation_id)
+        if operation is None:
+            operation = self._completed_operations.get(operation_id)
+        return operation
 
     def complete_operation(
         self,
@@ -237,7 +316,7 @@ class ProgressManager(QObject):
         error: GitWorktreeManagerError = None,
     ):
         """Complete an operation."""
-        operation = self._operations.get(operation_id)
+        operation = self.get_operation(operation_id)
         if not operation:
             return
 
@@ -255,7 +334,7 @@ class ProgressManager(QObject):
 
     def cancel_operation(self, operation_id: str):
         """Cancel an operation."""
-        operation = self._operations.get(operation_id)
+        operation = self.get_operation(operation_id)
         if operation:
             operation.cancel()
 
@@ -263,21 +342,22 @@ class ProgressManager(QObject):
         self, operation_id: str, progress: int, status: str = None
     ):
         """Update progress for an operation."""
-        operation = self._operations.get(operation_id)
+        operation = self.get_operation(operation_id)
         if operation:
             operation.update_progress(progress, status)
 
     def update_operation_status(self, operation_id: str, status: str):
         """Update status for an operation."""
-        operation = self._operations.get(operation_id)
+        operation = self.get_operation(operation_id)
         if operation:
             operation.update_status(status)
 
     def _on_operation_completed(self, operation_id: str, success: bool):
         """Handle operation completion."""
-        operation = self._operations.get(operation_id)
+        operation = self._active_operations.pop(operation_id, None)
         if not operation:
             return
+        self._completed_operations[operation_id] = operation
 
         # Update status bar
         if self.status_manager:
@@ -297,21 +377,19 @@ class ProgressManager(QObject):
         QTimer.singleShot(30000, lambda: self._cleanup_operation(operation_id))
 
         # Emit signal
-        self.operation_completed.emit(operation_id, success)
+        self.operation_completed.emit(operation_id, success, operation)
 
     def _cleanup_operation(self, operation_id: str):
         """Clean up completed operation."""
-        self._operations.pop(operation_id, None)
+        self._completed_operations.pop(operation_id, None)
 
     def get_active_operations(self) -> dict[str, OperationProgress]:
         """Get all active (non-completed) operations."""
-        return {
-            op_id: op for op_id, op in self._operations.items() if not op.is_completed
-        }
+        return dict(self._active_operations)
 
     def cancel_all_operations(self):
         """Cancel all active operations."""
-        for operation in self.get_active_operations().values():
+        for operation in list(self._active_operations.values()):
             operation.cancel()
 
 
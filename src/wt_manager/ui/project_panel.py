@@ -1,6 +1,8 @@
 """Project management panel for Git Worktree Manager."""
 
 import logging
+import subprocess
+import sys
 from pathlib import Path
 
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
@@ -56,7 +58,7 @@ class ProjectHealthDialog(QDialog):
         header_layout.addRow("Status:", self._create_status_label(self.project.status))
         header_layout.addRow(
             "Last Accessed:",
-            QLabel(self.project.last_accessed.strftime("%Y-%m-%d %H:%M:%S")),
+            QLabel(self.project.last_accessed.isoformat(" ", "seconds")),
         )
 
         layout.addWidget(header_group)
@@ -157,6 +159,9 @@ class ProjectHealthDialog(QDialog):
 class AddProjectDialog(QDialog):
     """Dialog for adding a new project."""
 
+    # Delay before validating a typed path
+    VALIDATION_DELAY_MS = 500
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Add Project")
@@ -262,7 +267,7 @@ class AddProjectDialog(QDialog):
         path = self.path_edit.text().strip()
         if path:
             # Start validation timer (debounced)
-            self.validation_timer.start(500)  # 500ms delay
+            self.validation_timer.start(self.VALIDATION_DELAY_MS)
             self._show_validation_progress()
         else:
             self._clear_validation()
@@ -584,9 +589,6 @@ class ProjectPanel(QWidget):
 
     def _open_in_file_manager(self, path: str):
         """Open project path in system file manager."""
-        import subprocess
-        import sys
-
         try:
             if sys.platform == "win32":
                 subprocess.run(["explorer", path], check=True)
@@ -655,7 +657,7 @@ class ProjectPanel(QWidget):
             f"Path: {project.path}\n"
             f"Status: {project.status.value}\n"
             f"Worktrees: {len(project.worktrees)}\n"
-            f"Last Accessed: {project.last_accessed.strftime('%Y-%m-%d %H:%M:%S')}"
+            f"Last Accessed: {project.last_accessed.isoformat(' ', 'seconds')}"
         )
 
     def _apply_status_styling(self, item: QListWidgetItem, status: ProjectStatus):
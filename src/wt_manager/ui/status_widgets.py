@@ -1,5 +1,8 @@
 """Status indicator widgets for showing operation feedback."""
 
+import math
+import weakref
+
 from PyQt6.QtWidgets import (
     QWidget,
     QHBoxLayout,
@@ -9,7 +12,8 @@ from PyQt6.QtWidgets import (
     QProgressBar,
     QScrollArea,
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QPropertyAnimation, QEasingCurve
+from PyQt6 import sip
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QColor
 
 from .progress_manager import OperationProgress, ProgressManager
@@ -18,32 +22,77 @@ from .progress_manager import OperationProgress, ProgressManager
 class StatusIndicator(QWidget):
     """A small status indicator widget that can show different states."""
 
+    PULSE_INTERVAL_MS = 33
+    PULSE_PERIOD_MS = 1000
+
+    # One timer drives the pulse of every working indicator
+    _shared_timer: QTimer | None = None
+    _working_indicators: "weakref.WeakSet[StatusIndicator]" = weakref.WeakSet()
+
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
         self.setFixedSize(20, 20)
         self._status = "idle"
-        self._animation = QPropertyAnimation(self, b"windowOpacity")
-        self._setup_animation()
-
-    def _setup_animation(self):
-        """Set up pulsing animation for active states."""
-        self._animation.setDuration(1000)
-        self._animation.setStartValue(0.3)
-        self._animation.setEndValue(1.0)
-        self._animation.setEasingCurve(QEasingCurve.Type.InOutSine)
-        self._animation.setLoopCount(-1)  # Infinite loop
+        self._phase = 0.0
+
+    @property
+    def _pulse_active(self) -> bool:
+        """Whether this indicator is pulsing from the shared timer."""
+        return self in StatusIndicator._working_indicators
+
+    @classmethod
+    def _live_indicators(cls) -> list["StatusIndicator"]:
+        """Drop indicators whose widgets were deleted and return the rest."""
+        for indicator in list(cls._working_indicators):
+            if sip.isdeleted(indicator):
+                cls._working_indicators.discard(indicator)
+        return list(cls._working_indicators)
+
+    @classmethod
+    def _tick(cls):
+        """Advance the pulse of all working indicators and repaint them."""
+        indicators = cls._live_indicators()
+        for indicator in indicators:
+            indicator._advance_phase()
+            indicator.update()
+
+        if not indicators:
+            cls._shared_timer.stop()
+
+    def _advance_phase(self):
+        """Move the pulse one timer tick forward."""
+        self._phase = (self._phase + self.PULSE_INTERVAL_MS / self.PULSE_PERIOD_MS) % 1
+
+    def _start_pulse(self):
+        """Register this indicator with the shared pulse timer."""
+        cls = StatusIndicator
+        cls._working_indicators.add(self)
+        if cls._shared_timer is None:
+            cls._shared_timer = QTimer()
+            cls._shared_timer.setTimerType(Qt.TimerType.CoarseTimer)
+            cls._shared_timer.setInterval(cls.PULSE_INTERVAL_MS)
+            cls._shared_timer.timeout.connect(cls._tick)
+        if not cls._shared_timer.isActive():
+            cls._shared_timer.start()
+
+    def _stop_pulse(self):
+        """Unregister this indicator, stopping the timer when none remain."""
+        cls = StatusIndicator
+        cls._working_indicators.discard(self)
+        self._phase = 0.0
+        if not cls._live_indicators() and cls._shared_timer is not None:
+            cls._shared_timer.stop()
 
     def set_status(self, status: str):
         """Set the status and update appearance."""
         self._status = status
         self.update()
 
-        # Start/stop animation based on status
+        # Start/stop pulsing based on status
         if status in ["working", "loading"]:
-            self._animation.start()
+            self._start_pulse()
         else:
-            self._animation.stop()
-            self.setWindowOpacity(1.0)
+            self._stop_pulse()
 
     def paintEvent(self, event):
         """Paint the status indicator."""
@@ -64,6 +113,10 @@ class StatusIndicator(QWidget):
         else:  # idle
             color = QColor(156, 163, 175)  # Gray
 
+        # Pulse between 30% and 100% opacity while working
+        if self._pulse_active:
+            color.setAlphaF(0.3 + 0.35 * (1 - math.cos(2 * math.pi * self._phase)))
+
         # Draw circle
         painter.setBrush(QBrush(color))
         painter.setPen(Qt.PenStyle.NoPen)
@@ -180,7 +233,18 @@ class OperationStatusPanel(QWidget):
     ):
         super().__init__(parent)
         self.progress_manager = progress_manager
-        self._operation_widgets: dict = {}
+        # Entries disappear once Qt deletes the widget, wherever that happens
+        self._operation_widgets: weakref.WeakValueDictionary[
+            str, OperationStatusWidget
+        ] = weakref.WeakValueDictionary()
+
+        # New widgets are inserted into the layout in one batch per event loop pass
+        self._pending_widgets: list[OperationStatusWidget] = []
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(0)
+        self._flush_timer.timeout.connect(self._flush_pending_widgets)
+
         self._setup_ui()
         self._connect_signals()
 
@@ -238,39 +302,55 @@ class OperationStatusPanel(QWidget):
         self.progress_manager.operation_started.connect(self._on_operation_started)
         self.progress_manager.operation_completed.connect(self._on_operation_completed)
 
-    def _on_operation_started(self, operation_id: str, description: str):
+    def _on_operation_started(
+        self, operation_id: str, description: str, operation: OperationProgress
+    ):
         """Handle new operation started."""
-        operation = self.progress_manager.get_operation(operation_id)
-        if operation:
-            widget = OperationStatusWidget(operation)
-            widget.cancel_requested.connect(self.progress_manager.cancel_operation)
+        widget = OperationStatusWidget(operation)
+        widget.cancel_requested.connect(self.progress_manager.cancel_operation)
+        self._operation_widgets[operation_id] = widget
 
+        self._pending_widgets.append(widget)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+        # Show panel if hidden
+        self.setVisible(True)
+
+    def _flush_pending_widgets(self):
+        """Insert all widgets queued since the last flush with a single relayout."""
+        if not self._pending_widgets:
+            return
+
+        self.operations_widget.setUpdatesEnabled(False)
+        for widget in self._pending_widgets:
             # Insert before stretch
             self.operations_layout.insertWidget(
                 self.operations_layout.count() - 1, widget
             )
-            self._operation_widgets[operation_id] = widget
-
-            # Show panel if hidden
-            self.setVisible(True)
+        self._pending_widgets.clear()
+        self.operations_widget.setUpdatesEnabled(True)
 
-    def _on_operation_completed(self, operation_id: str, success: bool):
+    def _on_operation_completed(
+        self, operation_id: str, success: bool, operation: OperationProgress
+    ):
         """Handle operation completion."""
         # Widget will handle its own completion display
         pass
 
     def _clear_completed(self):
         """Clear all completed operation widgets."""
-        to_remove = []
-        for op_id, widget in self._operation_widgets.items():
+        self.operations_widget.setUpdatesEnabled(False)
+        for op_id, widget in list(self._operation_widgets.items()):
             if widget.operation.is_completed:
-                widget.setVisible(False)
-                self.operations_layout.removeWidget(widget)
+                del self._operation_widgets[op_id]
+                if widget in self._pending_widgets:
+                    self._pending_widgets.remove(widget)
+                else:
+                    widget.setVisible(False)
+                    self.operations_layout.removeWidget(widget)
                 widget.deleteLater()
-                to_remove.append(op_id)
-
-        for op_id in to_remove:
-            del self._operation_widgets[op_id]
+        self.operations_widget.setUpdatesEnabled(True)
 
         # Hide panel if no operations
         if not self._operation_widgets:
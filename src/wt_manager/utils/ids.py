@@ -0,0 +1,39 @@
+"""Identifier generation helpers."""
+
+import os
+import threading
+import uuid
+
+_POOL_SIZE = 128
+
+_uuid_pool: list[str] = []
+_uuid_pool_lock = threading.Lock()
+
+
+def _refill_uuid_pool() -> None:
+    """Fill the pool with random UUIDs from a single os.urandom call."""
+    random_bytes = os.urandom(16 * _POOL_SIZE)
+    _uuid_pool.extend(
+        str(uuid.UUID(bytes=random_bytes[offset : offset + 16], version=4))
+        for offset in range(0, len(random_bytes), 16)
+    )
+
+
+def new_id() -> str:
+    """
+    Generate a random (version 4) UUID string.
+
+    UUIDs are generated in batches so that creating many models only
+    reads from the system random source once per batch.
+
+    Returns:
+        str: New UUID string
+    """
+    with _uuid_pool_lock:
+        if not _uuid_pool:
+            _refill_uuid_pool()
+        return _uuid_pool.pop()
+
+
+# A forked child must not hand out the same identifiers as its parent
+os.register_at_fork(after_in_child=_uuid_pool.clear)
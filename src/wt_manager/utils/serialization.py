@@ -0,0 +1,46 @@
+"""JSON serialization helpers shared by the data models."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
+
+def dumps_json(data: Any) -> str:
+    """
+    Serialize data to an indented JSON string.
+
+    Uses orjson when available and falls back to the standard library
+    otherwise; both produce the same two-space indented output.
+
+    Args:
+        data: JSON-compatible data to serialize
+
+    Returns:
+        str: JSON representation of the data
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def loads_json(json_str: str | bytes) -> Any:
+    """
+    Deserialize a JSON string.
+
+    Args:
+        json_str: JSON string to parse
+
+    Returns:
+        Any: Parsed data
+
+    Raises:
+        json.JSONDecodeError: If the string is not valid JSON
+            (orjson.JSONDecodeError is a subclass)
+    """
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
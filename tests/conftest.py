@@ -0,0 +1,53 @@
+"""Shared pytest fixtures for the Git Worktree Manager test suite."""
+
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from wt_manager.models import CommandExecution, CommandHistory
+
+# Shared construction timestamp for fixtures that never inspect the current time
+FIXED_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture(scope="session")
+def git_tempdir(tmp_path_factory):
+    """Create one directory with a `.git` folder shared by read-only model tests."""
+    temp_dir = tmp_path_factory.mktemp("models")
+    (temp_dir / ".git").mkdir()
+    return str(temp_dir)
+
+
+@pytest.fixture(scope="session")
+def git_tempdir_name(git_tempdir):
+    """Return the directory name of the shared `git_tempdir`."""
+    return os.path.basename(git_tempdir)
+
+
+def _make_executions(ids, commands, worktree_path="/tmp/test", base_time=FIXED_NOW):
+    """Create pending executions starting one microsecond apart, in order."""
+    return [
+        CommandExecution(
+            id_, command, worktree_path, base_time + timedelta(microseconds=i)
+        )
+        for i, (id_, command) in enumerate(zip(ids, commands, strict=True))
+    ]
+
+
+@pytest.fixture(scope="session")
+def make_executions():
+    """Return a factory for pending executions with increasing start times."""
+    return _make_executions
+
+
+@pytest.fixture
+def preloaded_history():
+    """Create a CommandHistory holding ten pending `echo` executions, oldest first."""
+    history = CommandHistory()
+    for execution in _make_executions(
+        [f"cmd-{i}" for i in range(10)],
+        [f"echo {i}" for i in range(10)],
+    ):
+        history.add_execution(execution)
+    return history
@@ -8,13 +8,20 @@ from unittest.mock import patch
 
 import pytest
 
-from wt_manager.models.command_execution import CommandExecution, CommandStatus
+from wt_manager.models.command_execution import (
+    CommandExecution,
+    CommandHistory,
+    CommandStatus,
+)
 from wt_manager.services.command_manager import (
+    LEGACY_STATE_FILE_NAME,
+    STATE_FILE_NAME,
     CommandExecutionState,
     CommandManager,
     get_command_manager,
     initialize_command_manager,
 )
+from wt_manager.utils.serialization import dumps_json
 
 
 class TestCommandExecutionState:
@@ -210,7 +217,7 @@ class TestCommandExecutionState:
 
     def test_state_persistence(self):
         """Test state persistence to file."""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
+        with tempfile.NamedTemporaryFile(delete=False, suffix=".msgpack") as f:
             state_file = Path(f.name)
 
         try:
@@ -247,6 +254,36 @@ class TestCommandExecutionState:
             if state_file.exists():
                 state_file.unlink()
 
+    def test_legacy_json_state_migrated(self):
+        """Test a legacy JSON state file is loaded and re-saved as msgpack."""
+        execution = CommandExecution(
+            id="legacy-test",
+            command="echo 'legacy'",
+            worktree_path=self.temp_dir,
+            start_time=datetime.now(),
+        )
+        execution.mark_completed(0)
+        legacy_history = CommandHistory(executions=[execution])
+        state_dir = Path(self.temp_dir)
+        (state_dir / LEGACY_STATE_FILE_NAME).write_text(
+            dumps_json(
+                {
+                    "statistics": {"total_executions": 1},
+                    "global_history": legacy_history.to_dict(),
+                    "worktree_histories": {},
+                }
+            )
+        )
+
+        self.state._state_file = state_dir / STATE_FILE_NAME
+        self.state._load_state()
+
+        loaded_execution = self.state.get_execution("legacy-test")
+        assert loaded_execution is not None
+        assert loaded_execution.command == "echo 'legacy'"
+        assert self.state._total_executions == 1
+        assert self.state._state_file.exists()
+
     def test_thread_safety(self):
         """Test thread safety of state operations."""
         threads = []
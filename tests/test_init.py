@@ -1,11 +1,25 @@
+import os
+import sys
+
+import pytest
+
 from wt_manager import main
 
+# Linux needs an X11/Wayland display (or an explicit Qt platform such as
+# "offscreen") before any widget can be created.
+NO_DISPLAY = sys.platform == "linux" and not (
+    os.environ.get("DISPLAY")
+    or os.environ.get("WAYLAND_DISPLAY")
+    or os.environ.get("QT_QPA_PLATFORM")
+)
+
 
 def test_main_function_exists():
     """Test that the main function is callable."""
     assert callable(main)
 
 
+@pytest.mark.skipif(NO_DISPLAY, reason="no display available")
 def test_window_creation(qtbot):
     """Test that the main window can be created."""
     # Since main() runs the app loop, we can't call it directly in tests
@@ -1,10 +1,13 @@
 """Test cases for the data models."""
 
 import json
-import tempfile
-from datetime import datetime, timedelta
+import uuid
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from unittest.mock import patch
+
 import pytest
+from conftest import FIXED_NOW
 
 from wt_manager.models import (
     CommandExecution,
@@ -14,6 +17,11 @@ from wt_manager.models import (
     ProjectStatus,
     Worktree,
 )
+from wt_manager.models.worktree import clear_path_cache
+
+# Shared payloads for the deserialization error tests
+INVALID_JSON = "invalid json"
+ID_ONLY_DICT = {"id": "test"}
 
 
 class TestWorktreeModel:
@@ -103,126 +111,203 @@ class TestWorktreeModel:
 
         assert worktree1 == worktree2  # Same path
         assert worktree1 != worktree3  # Different path
+        assert worktree1.__eq__(worktree1) is True  # Same object
+        assert worktree1 != "/tmp/test"  # Different type
+
+        # Paths that only match once normalized still compare equal
+        worktree4 = Worktree(path="/tmp/./test", branch="main", commit_hash="abc123")
+        assert worktree1 == worktree4
+        assert hash(worktree1) == hash(worktree4)
+
+    def test_path_resolves_symlinks(self, tmp_path):
+        """Test that absolute worktree paths are still resolved through symlinks."""
+        target = tmp_path / "target"
+        target.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(target)
+
+        worktree = Worktree(path=str(link), branch="main", commit_hash="abc123")
+
+        assert worktree.path == str(target.resolve())
+
+        # Repointing the link is only picked up once the cache is cleared
+        other = tmp_path / "other"
+        other.mkdir()
+        link.unlink()
+        link.symlink_to(other)
+        clear_path_cache()
+
+        worktree = Worktree(path=str(link), branch="main", commit_hash="abc123")
+        assert worktree.path == str(other.resolve())
 
 
 class TestProjectModel:
     """Test cases for the Project model."""
 
-    def test_project_creation(self):
+    def test_project_creation(self, git_tempdir):
         """Test basic project creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project = Project(
-                id="test-project-1",
-                name="Test Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
+        project = Project(
+            id="test-project-1",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
 
-            assert project.id == "test-project-1"
-            assert project.name == "Test Project"
-            assert project.path == str(Path(temp_dir).resolve())
-            assert project.status == ProjectStatus.ACTIVE
+        assert project.id == "test-project-1"
+        assert project.name == "Test Project"
+        assert project.path == str(Path(git_tempdir).resolve())
+        assert project.status == ProjectStatus.ACTIVE
 
-    def test_project_validation(self):
+    def test_project_validation(self, git_tempdir):
         """Test project validation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a fake .git directory
-            git_dir = Path(temp_dir) / ".git"
-            git_dir.mkdir()
+        # The shared fixture already contains a fake .git directory
+        project = Project(
+            id="test-project",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
 
-            project = Project(
-                id="test-project",
-                name="Test Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
+        assert project.is_valid() is True
 
-            assert project.is_valid() is True
+    def test_project_validity_follows_git_directory(self, tmp_path):
+        """Test that validity follows .git appearing and disappearing."""
+        project = Project(
+            id="test-id",
+            name="Test",
+            path=str(tmp_path),
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        assert project.is_valid() is False
 
-    def test_display_name(self):
+        (tmp_path / ".git").mkdir()
+        assert project.is_valid() is True
+        assert project.is_valid() is True
+
+        (tmp_path / ".git").rmdir()
+        assert project.is_valid() is False
+
+    def test_display_name(self, git_tempdir, git_tempdir_name):
         """Test display name functionality."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test with explicit name
-            project = Project(
-                id="test-1",
-                name="My Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
-            assert project.get_display_name() == "My Project"
+        # Test with explicit name
+        project = Project(
+            id="test-1",
+            name="My Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        assert project.get_display_name() == "My Project"
 
-            # Test with empty name (should use directory name)
-            project.name = ""
-            expected_name = Path(temp_dir).name
-            assert project.get_display_name() == expected_name
+        # Test with empty name (should use directory name)
+        project.name = ""
+        assert project.get_display_name() == git_tempdir_name
 
-    def test_worktree_management(self):
+    def test_worktree_management(self, git_tempdir):
         """Test worktree management functionality."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project = Project(
-                id="test-project",
-                name="Test Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
+        project = Project(
+            id="test-project",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
 
-            # Add worktree
-            worktree = Worktree(
-                path=f"{temp_dir}/worktree1",
-                branch="feature-branch",
-                commit_hash="def456abc123",
-            )
-            project.add_worktree(worktree)
-            assert len(project.worktrees) == 1
+        # Add worktree
+        worktree = Worktree(
+            path=f"{git_tempdir}/worktree1",
+            branch="feature-branch",
+            commit_hash="def456abc123",
+        )
+        project.add_worktree(worktree)
+        assert len(project.worktrees) == 1
 
-            # Get worktree by path
-            found = project.get_worktree_by_path(worktree.path)
-            assert found == worktree
+        # Get worktree by path
+        found = project.get_worktree_by_path(worktree.path)
+        assert found == worktree
 
-            # Remove worktree
-            removed = project.remove_worktree(worktree.path)
-            assert removed is True
-            assert len(project.worktrees) == 0
+        # Remove worktree
+        removed = project.remove_worktree(worktree.path)
+        assert removed is True
+        assert len(project.worktrees) == 0
 
-            # Try to remove non-existent worktree
-            removed = project.remove_worktree("/non/existent/path")
-            assert removed is False
+        # Try to remove non-existent worktree
+        removed = project.remove_worktree("/non/existent/path")
+        assert removed is False
 
-    def test_serialization(self):
+    def test_worktree_lookup_tracks_list_changes(self, git_tempdir):
+        """Test worktree lookups follow direct changes to the worktrees list."""
+        project = Project(
+            id="test-project",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        first = Worktree(
+            path=f"{git_tempdir}/worktree1", branch="feature", commit_hash="def456"
+        )
+        second = Worktree(
+            path=f"{git_tempdir}/worktree2", branch="main", commit_hash="abc123"
+        )
+        third = Worktree(
+            path=f"{git_tempdir}/worktree3", branch="fix", commit_hash="123abc"
+        )
+
+        # Replacing the list
+        project.worktrees = [second]
+        assert project.get_worktree_by_path(second.path) is second
+        assert project.get_worktree_by_path(first.path) is None
+
+        # Appending directly
+        project.worktrees.append(first)
+        assert project.get_worktree_by_path(first.path) is first
+
+        # Replacing an element in place at the same length
+        project.worktrees[0] = third
+        assert project.get_worktree_by_path(third.path) is third
+        assert project.get_worktree_by_path(second.path) is None
+
+        # Adding a worktree with a known path is a no-op
+        project.add_worktree(
+            Worktree(path=first.path, branch="other", commit_hash="fff000")
+        )
+        assert len(project.worktrees) == 2
+        assert project.get_worktree_by_path(first.path) is first
+
+    def test_serialization(self, git_tempdir):
         """Test project serialization and deserialization."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            original = Project(
-                id="test-project-1",
-                name="Test Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
+        original = Project(
+            id="test-project-1",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
 
-            # Add a worktree
-            worktree = Worktree(
-                path=f"{temp_dir}/worktree1", branch="main", commit_hash="abc123"
-            )
-            original.add_worktree(worktree)
+        # Add a worktree
+        worktree = Worktree(
+            path=f"{git_tempdir}/worktree1", branch="main", commit_hash="abc123"
+        )
+        original.add_worktree(worktree)
 
-            # Test dict serialization
-            data = original.to_dict()
-            restored = Project.from_dict(data)
+        # Test dict serialization
+        data = original.to_dict()
+        restored = Project.from_dict(data)
 
-            assert restored.id == original.id
-            assert restored.name == original.name
-            assert restored.path == original.path
-            assert restored.status == original.status
-            assert len(restored.worktrees) == len(original.worktrees)
+        assert restored.id == original.id
+        assert restored.name == original.name
+        assert restored.path == original.path
+        assert restored.status == original.status
+        assert len(restored.worktrees) == len(original.worktrees)
 
-            # Test JSON serialization
-            json_str = original.to_json()
-            from_json = Project.from_json(json_str)
-            assert from_json == original
+        # Test JSON serialization
+        json_str = original.to_json()
+        from_json = Project.from_json(json_str)
+        assert from_json == original
 
     def test_equality(self):
         """Test project equality comparison."""
@@ -231,21 +316,21 @@ class TestProjectModel:
             name="Project 1",
             path="/tmp/proj1",
             status=ProjectStatus.ACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
         project2 = Project(
             id="test-1",
             name="Different Name",
             path="/tmp/proj2",
             status=ProjectStatus.INACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
         project3 = Project(
             id="test-2",
             name="Project 1",
             path="/tmp/proj1",
             status=ProjectStatus.ACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
 
         assert project1 == project2  # Same ID
@@ -279,7 +364,7 @@ class TestCommandExecutionModel:
             id="test-cmd",
             command="echo hello",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         self._test_execution_started(execution)
@@ -312,56 +397,35 @@ class TestCommandExecutionModel:
         assert execution.is_successful() is True
         assert execution.end_time is not None
 
-    def test_command_execution_failure(self):
-        """Test command execution failure handling."""
-        execution = CommandExecution(
-            id="test-cmd",
-            command="false",
-            worktree_path="/tmp/test",
-            start_time=datetime.now(),
-        )
-
-        execution.mark_started()
-        execution.mark_completed(exit_code=1)
-
-        assert execution.status == CommandStatus.FAILED
-        assert execution.exit_code == 1
-        assert execution.is_successful() is False
-        assert execution.is_finished() is True
-
-    def test_command_execution_cancellation(self):
-        """Test command execution cancellation."""
+    @pytest.mark.parametrize(
+        ("finish", "expected_status", "exit_code"),
+        [
+            (lambda e: e.mark_completed(exit_code=1), CommandStatus.FAILED, 1),
+            (lambda e: e.mark_cancelled(), CommandStatus.CANCELLED, None),
+            (lambda e: e.mark_timeout(), CommandStatus.TIMEOUT, None),
+        ],
+        ids=["failure", "cancellation", "timeout"],
+    )
+    def test_command_execution_unsuccessful_finish(
+        self, finish, expected_status, exit_code
+    ):
+        """Test failure, cancellation and timeout handling."""
         execution = CommandExecution(
             id="test-cmd",
             command="sleep 10",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
-        )
-
-        execution.mark_started()
-        execution.mark_cancelled()
-
-        assert execution.status == CommandStatus.CANCELLED
-        assert execution.is_finished() is True
-        assert execution.is_successful() is False
-        assert execution.end_time is not None
-
-    def test_command_execution_timeout(self):
-        """Test command execution timeout handling."""
-        execution = CommandExecution(
-            id="test-cmd",
-            command="sleep 100",
-            worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
             timeout_seconds=5,
         )
 
         execution.mark_started()
-        execution.mark_timeout()
+        finish(execution)
 
-        assert execution.status == CommandStatus.TIMEOUT
+        assert execution.status == expected_status
+        assert execution.exit_code == exit_code
         assert execution.is_finished() is True
         assert execution.is_successful() is False
+        assert execution.end_time is not None
 
     def test_duration_calculation(self):
         """Test duration calculation methods."""
@@ -391,13 +455,65 @@ class TestCommandExecutionModel:
         duration_display = execution.get_duration_display()
         assert "2.5s" in duration_display
 
+    def test_duration_uses_monotonic_clock(self):
+        """Test that completed durations come from the monotonic clock."""
+        with patch(
+            "wt_manager.models.command_execution.time.monotonic_ns",
+            side_effect=[10_000_000_000, 12_500_000_000],
+        ):
+            execution = CommandExecution(
+                id="test-cmd",
+                command="echo test",
+                worktree_path="/tmp/test",
+                start_time=datetime.now(),
+            )
+            execution.mark_started()
+            execution.mark_completed(exit_code=0)
+
+        # Only the microseconds between start_time and construction are added
+        duration = execution.get_duration()
+        assert timedelta(seconds=2.5) <= duration < timedelta(seconds=2.6)
+        assert execution.end_time is not None
+
+    def test_duration_includes_queued_time(self):
+        """Test that time queued before mark_started() counts towards duration."""
+        execution = CommandExecution(
+            id="test-cmd",
+            command="sleep 10",
+            worktree_path="/tmp/test",
+            start_time=datetime.now() - timedelta(seconds=10),
+            timeout_seconds=5,
+        )
+
+        execution.mark_started()
+
+        assert execution.get_duration() >= timedelta(seconds=10)
+        assert execution.is_timed_out() is True
+
+    def test_duration_with_timezone_aware_start_time(self):
+        """Test that a timezone-aware start time restored from a dict works."""
+        data = CommandExecution(
+            id="test-cmd",
+            command="echo test",
+            worktree_path="/tmp/test",
+            start_time=FIXED_NOW,
+        ).to_dict()
+        start_time = datetime.now(timezone(timedelta(hours=2))) - timedelta(seconds=3)
+        data["start_time"] = start_time.isoformat()
+
+        execution = CommandExecution.from_dict(data)
+        execution.mark_started()
+
+        assert execution.start_time == start_time
+        assert execution.get_duration() >= timedelta(seconds=3)
+
     def test_output_formatting(self):
         """Test output formatting methods."""
         execution = CommandExecution(
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test with no output
@@ -424,7 +540,7 @@ class TestCommandExecutionModel:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test pending status
@@ -447,7 +563,7 @@ class TestCommandExecutionModel:
             id="test-cmd",
             command=long_command,
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test truncation
@@ -545,19 +661,19 @@ class TestCommandExecutionModel:
             id="test-1",
             command="git status",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution2 = CommandExecution(
             id="test-1",
             command="git log",
             worktree_path="/tmp/other",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution3 = CommandExecution(
             id="test-2",
             command="git status",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         assert execution1 == execution2  # Same ID
@@ -583,13 +699,13 @@ class TestCommandHistoryModel:
             id="cmd-1",
             command="git status",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution2 = CommandExecution(
             id="cmd-2",
             command="git log",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         history.add_execution(execution1)
@@ -602,18 +718,16 @@ class TestCommandHistoryModel:
         assert history.executions[0] == execution2
         assert history.executions[1] == execution1
 
-    def test_history_size_limit(self):
+    def test_history_size_limit(self, make_executions):
         """Test history size limiting."""
         history = CommandHistory(max_history_size=3)
 
         # Add more executions than the limit
-        for i in range(5):
-            execution = CommandExecution(
-                id=f"cmd-{i}",
-                command=f"echo {i}",
-                worktree_path="/tmp/test",
-                start_time=datetime.now(),
-            )
+        executions = make_executions(
+            [f"cmd-{i}" for i in range(5)],
+            [f"echo {i}" for i in range(5)],
+        )
+        for execution in executions:
             history.add_execution(execution)
 
         # Should only keep the most recent 3
@@ -621,22 +735,9 @@ class TestCommandHistoryModel:
         assert history.executions[0].command == "echo 4"  # Most recent
         assert history.executions[2].command == "echo 2"  # Oldest kept
 
-    def test_get_recent_executions(self):
+    def test_get_recent_executions(self, preloaded_history):
         """Test getting recent executions."""
-        history = CommandHistory()
-
-        # Add several executions
-        for i in range(10):
-            execution = CommandExecution(
-                id=f"cmd-{i}",
-                command=f"echo {i}",
-                worktree_path="/tmp/test",
-                start_time=datetime.now(),
-            )
-            history.add_execution(execution)
-
-        # Get recent executions
-        recent = history.get_recent_executions(limit=3)
+        recent = preloaded_history.get_recent_executions(limit=3)
         assert len(recent) == 3
         assert recent[0].command == "echo 9"  # Most recent
         assert recent[2].command == "echo 7"
@@ -650,7 +751,7 @@ class TestCommandHistoryModel:
             id="running-cmd",
             command="sleep 10",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         running_exec.mark_started()
 
@@ -658,7 +759,7 @@ class TestCommandHistoryModel:
             id="completed-cmd",
             command="echo done",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         completed_exec.mark_completed(exit_code=0)
 
@@ -677,7 +778,7 @@ class TestCommandHistoryModel:
             id="test-cmd-id",
             command="git status",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         history.add_execution(execution)
 
@@ -687,18 +788,16 @@ class TestCommandHistoryModel:
         not_found = history.get_execution_by_id("non-existent")
         assert not_found is None
 
-    def test_get_executions_by_command(self):
+    def test_get_executions_by_command(self, make_executions):
         """Test getting executions by command."""
         history = CommandHistory()
 
         # Add multiple executions with same command
-        for i in range(3):
-            execution = CommandExecution(
-                id=f"cmd-{i}",
-                command="git status",
-                worktree_path="/tmp/test",
-                start_time=datetime.now(),
-            )
+        executions = make_executions(
+            [f"cmd-{i}" for i in range(3)],
+            ["git status"] * 3,
+        )
+        for execution in executions:
             history.add_execution(execution)
 
         # Add different command
@@ -706,7 +805,7 @@ class TestCommandHistoryModel:
             id="other-cmd",
             command="git log",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         history.add_execution(other_execution)
 
@@ -716,6 +815,34 @@ class TestCommandHistoryModel:
         log_executions = history.get_executions_by_command("git log")
         assert len(log_executions) == 1
 
+    def test_lookups_follow_evictions_and_removals(self):
+        """Test that id and command lookups stay in sync with the history."""
+        history = CommandHistory(max_history_size=2)
+
+        now = datetime.now()
+        for i in range(3):
+            execution = CommandExecution(
+                id=f"cmd-{i}",
+                command="git status" if i % 2 == 0 else "git log",
+                worktree_path="/tmp/test",
+                start_time=now + timedelta(microseconds=i),
+            )
+            history.add_execution(execution)
+
+        # cmd-0 was evicted by the size limit
+        assert history.get_execution_by_id("cmd-0") is None
+        assert [e.id for e in history.get_executions_by_command("git status")] == [
+            "cmd-2"
+        ]
+
+        assert history.remove_execution("cmd-1") is True
+        assert history.get_execution_by_id("cmd-1") is None
+        assert history.get_executions_by_command("git log") == []
+
+        history.clear_history()
+        assert history.get_execution_by_id("cmd-2") is None
+        assert history.get_executions_by_command("git status") == []
+
     def test_get_successful_and_failed_executions(self):
         """Test getting successful and failed executions."""
         history = CommandHistory()
@@ -725,7 +852,7 @@ class TestCommandHistoryModel:
             id="success-cmd",
             command="echo success",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         success_exec.mark_completed(exit_code=0)
 
@@ -734,7 +861,7 @@ class TestCommandHistoryModel:
             id="failed-cmd",
             command="false",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         failed_exec.mark_completed(exit_code=1)
 
@@ -757,7 +884,7 @@ class TestCommandHistoryModel:
             id="test-cmd",
             command="git status",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         history.add_execution(execution)
 
@@ -772,24 +899,33 @@ class TestCommandHistoryModel:
         removed = history.remove_execution("non-existent")
         assert removed is False
 
-    def test_clear_history(self):
-        """Test clearing history."""
-        history = CommandHistory()
+    def test_prune_executions(self, make_executions):
+        """Test pruning executions with a predicate."""
+        history = CommandHistory(max_history_size=3)
 
-        # Add some executions
-        for i in range(5):
-            execution = CommandExecution(
-                id=f"cmd-{i}",
-                command=f"echo {i}",
-                worktree_path="/tmp/test",
-                start_time=datetime.now(),
-            )
+        executions = make_executions(
+            [f"cmd-{i}" for i in range(4)],
+            [f"echo {i}" for i in range(4)],
+        )
+        for execution in executions:
             history.add_execution(execution)
 
-        assert len(history) == 5
+        removed = history.prune_executions(lambda e: e.command != "echo 2")
+        assert removed == 1
+        assert [e.id for e in history.executions] == ["cmd-3", "cmd-1"]
 
-        history.clear_history()
-        assert len(history) == 0
+        # The size limit still applies after pruning
+        for execution in make_executions(["cmd-4", "cmd-5"], ["echo 4", "echo 5"]):
+            history.add_execution(execution)
+        assert len(history) == 3
+        assert history.executions[0].id == "cmd-5"
+
+    def test_clear_history(self, preloaded_history):
+        """Test clearing history."""
+        assert len(preloaded_history) == 10
+
+        preloaded_history.clear_history()
+        assert len(preloaded_history) == 0
 
     def test_get_statistics(self):
         """Test getting history statistics."""
@@ -802,11 +938,12 @@ class TestCommandHistoryModel:
         assert stats["failed"] == 0
 
         # Add various executions
+        now = datetime.now()
         success_exec = CommandExecution(
             id="success",
             command="echo success",
             worktree_path="/tmp/test",
-            start_time=datetime.now() - timedelta(seconds=2),
+            start_time=now - timedelta(seconds=2),
         )
         success_exec.mark_completed(exit_code=0)
 
@@ -814,7 +951,7 @@ class TestCommandHistoryModel:
             id="failed",
             command="false",
             worktree_path="/tmp/test",
-            start_time=datetime.now() - timedelta(seconds=1),
+            start_time=now - timedelta(seconds=1),
         )
         failed_exec.mark_completed(exit_code=1)
 
@@ -822,7 +959,7 @@ class TestCommandHistoryModel:
             id="running",
             command="sleep 10",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=now,
         )
         running_exec.mark_started()
 
@@ -848,7 +985,7 @@ class TestCommandHistoryModel:
             id="test-cmd",
             command="git status",
             worktree_path="/tmp/test-worktree",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         original.add_execution(execution)
 
@@ -916,35 +1053,34 @@ class TestModelValidation:
     def test_worktree_invalid_json_handling(self):
         """Test worktree handling of invalid JSON."""
         with pytest.raises(json.JSONDecodeError):
-            Worktree.from_json("invalid json")
+            Worktree.from_json(INVALID_JSON)
 
         # Test with missing required fields
         with pytest.raises(KeyError):
             Worktree.from_dict({"path": "/tmp/test"})  # Missing branch and commit_hash
 
-    def test_project_validation_edge_cases(self):
+    def test_project_validation_edge_cases(self, git_tempdir, git_tempdir_name):
         """Test project validation with edge cases."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Test project with empty name
-            project = Project(
-                id="test-id",
-                name="",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
-            # Should use directory name as display name
-            assert project.get_display_name() == Path(temp_dir).name
-
-            # Test project with non-existent path
-            project = Project(
-                id="test-id",
-                name="Test",
-                path="/non/existent/path",
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
-            assert not project.is_valid()
+        # Test project with empty name
+        project = Project(
+            id="test-id",
+            name="",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        # Should use directory name as display name
+        assert project.get_display_name() == git_tempdir_name
+
+        # Test project with non-existent path
+        project = Project(
+            id="test-id",
+            name="Test",
+            path="/non/existent/path",
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        assert not project.is_valid()
 
     def test_project_auto_id_generation(self):
         """Test project automatic ID generation."""
@@ -953,29 +1089,42 @@ class TestModelValidation:
             name="Test Project",
             path="/tmp/test",
             status=ProjectStatus.ACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
         assert project.id != ""
         assert len(project.id) > 0
 
-    def test_project_serialization_edge_cases(self):
-        """Test project serialization with edge cases."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        # Generated IDs are distinct version 4 UUIDs
+        ids = {
             Project(
-                id="test-id",
+                id="",
                 name="Test Project",
-                path=temp_dir,
+                path="/tmp/test",
                 status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
+                last_accessed=FIXED_NOW,
+            ).id
+            for _ in range(200)
+        }
+        assert len(ids) == 200
+        assert all(uuid.UUID(project_id).version == 4 for project_id in ids)
+
+    def test_project_serialization_edge_cases(self, git_tempdir):
+        """Test project serialization with edge cases."""
+        Project(
+            id="test-id",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
 
-            # Test with invalid JSON
-            with pytest.raises(json.JSONDecodeError):
-                Project.from_json("invalid json")
+        # Test with invalid JSON
+        with pytest.raises(json.JSONDecodeError):
+            Project.from_json(INVALID_JSON)
 
-            # Test with missing required fields
-            with pytest.raises(KeyError):
-                Project.from_dict({"id": "test"})  # Missing required fields
+        # Test with missing required fields
+        with pytest.raises(KeyError):
+            Project.from_dict(ID_ONLY_DICT)  # Missing required fields
 
     def test_command_execution_validation(self):
         """Test command execution validation and edge cases."""
@@ -984,7 +1133,7 @@ class TestModelValidation:
             id="",
             command="test command",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         assert execution.id != ""
         assert len(execution.id) > 0
@@ -1005,7 +1154,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test initial state
@@ -1020,7 +1169,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test transition to running
@@ -1036,7 +1185,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test transition to completed (success)
@@ -1055,7 +1204,7 @@ class TestModelValidation:
             id="test-cmd-2",
             command="false",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution.mark_started()
         execution.mark_completed(exit_code=1)
@@ -1068,7 +1217,7 @@ class TestModelValidation:
             id="test-cmd-3",
             command="sleep 10",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution.mark_started()
         execution.mark_cancelled()
@@ -1082,7 +1231,7 @@ class TestModelValidation:
             id="test-cmd-4",
             command="sleep 100",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution.mark_started()
         execution.mark_timeout()
@@ -1096,7 +1245,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test incremental output appending
@@ -1115,6 +1264,16 @@ class TestModelValidation:
         assert "line 1" in formatted
         assert "warning 1" in formatted
 
+        # Appends after a read or an assignment keep accumulating
+        execution.append_stdout("line 3\n")
+        assert execution.stdout == "line 1\nline 2\nline 3\n"
+        execution.stdout = "reset\n"
+        execution.append_stdout("after\n")
+        assert execution.stdout == "reset\nafter\n"
+
+        # The joined output is cached until new output arrives
+        assert execution.stdout is execution.stdout
+
     def test_command_execution_timeout_edge_cases(self):
         """Test command execution timeout edge cases."""
         # Test timeout detection with no timeout set
@@ -1139,7 +1298,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
 
         # Test serialization with None end_time
@@ -1151,11 +1310,11 @@ class TestModelValidation:
 
         # Test with invalid JSON
         with pytest.raises(json.JSONDecodeError):
-            CommandExecution.from_json("invalid json")
+            CommandExecution.from_json(INVALID_JSON)
 
         # Test with missing required fields
         with pytest.raises(KeyError):
-            CommandExecution.from_dict({"id": "test"})
+            CommandExecution.from_dict(ID_ONLY_DICT)
 
     def test_command_history_edge_cases(self):
         """Test command history edge cases."""
@@ -1173,7 +1332,7 @@ class TestModelValidation:
             id="test-cmd",
             command="echo test",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         # Don't set end_time, so duration is None
         history.add_execution(execution)
@@ -1197,27 +1356,22 @@ class TestModelValidation:
         assert "Worktree" in repr_str
         assert "/tmp/test-worktree" in repr_str
 
-    def test_project_string_representations(self):
+    def test_project_string_representations(self, git_tempdir):
         """Test Project string representations."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Create a fake .git directory to make project valid
-            git_dir = Path(temp_dir) / ".git"
-            git_dir.mkdir()
-
-            project = Project(
-                id="test-id",
-                name="Test Project",
-                path=temp_dir,
-                status=ProjectStatus.ACTIVE,
-                last_accessed=datetime.now(),
-            )
-            str_repr = str(project)
-            assert "Test Project" in str_repr
-            assert "active" in str_repr
+        project = Project(
+            id="test-id",
+            name="Test Project",
+            path=git_tempdir,
+            status=ProjectStatus.ACTIVE,
+            last_accessed=FIXED_NOW,
+        )
+        str_repr = str(project)
+        assert "Test Project" in str_repr
+        assert "active" in str_repr
 
-            repr_str = repr(project)
-            assert "Project" in repr_str
-            assert "test-id" in repr_str
+        repr_str = repr(project)
+        assert "Project" in repr_str
+        assert "test-id" in repr_str
 
     def test_command_execution_string_representations(self):
         """Test CommandExecution string representations."""
@@ -1225,7 +1379,7 @@ class TestModelValidation:
             id="test-cmd",
             command="git status --porcelain",
             worktree_path="/tmp/test",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         str_repr = str(execution)
         assert "CommandExecution" in str_repr
@@ -1269,14 +1423,14 @@ class TestModelValidation:
             name="Project 1",
             path="/tmp/proj1",
             status=ProjectStatus.ACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
         project2 = Project(
             id="same-id",
             name="Project 2",
             path="/tmp/proj2",
             status=ProjectStatus.INACTIVE,
-            last_accessed=datetime.now(),
+            last_accessed=FIXED_NOW,
         )
         assert project1 == project2  # Same ID
         assert hash(project1) == hash(project2)
@@ -1286,13 +1440,13 @@ class TestModelValidation:
             id="same-id",
             command="echo 1",
             worktree_path="/tmp/test1",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         execution2 = CommandExecution(
             id="same-id",
             command="echo 2",
             worktree_path="/tmp/test2",
-            start_time=datetime.now(),
+            start_time=FIXED_NOW,
         )
         assert execution1 == execution2  # Same ID
         assert hash(execution1) == hash(execution2)
@@ -1301,3 +1455,7 @@ class TestModelValidation:
         assert worktree1 != "not a worktree"
         assert project1 != "not a project"
         assert execution1 != "not an execution"
+
+        # Slotted models reject undeclared attributes
+        with pytest.raises(AttributeError):
+            project1.undeclared = True
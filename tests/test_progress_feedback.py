@@ -1,7 +1,6 @@
 """Tests for progress feedback and status management."""
 
 import pytest
-from unittest.mock import Mock, patch
 from PyQt6.QtWidgets import QWidget, QStatusBar
 
 from wt_manager.ui.progress_manager import (
@@ -58,50 +57,68 @@ class TestOperationProgress:
         operation.update_progress(-10)
         assert operation.progress == 0
 
-    def test_update_status_only(self, qtbot):
-        """Test updating only status message."""
+    def test_update_progress_burst_is_coalesced(self, qtbot):
+        """Test rapid progress updates emit once now and once with the latest value."""
         operation = OperationProgress("test_op", "Test operation")
+        emitted = []
+        operation.progress_changed.connect(emitted.append)
 
-        with qtbot.waitSignal(operation.status_changed, timeout=1000):
-            operation.update_status("Processing files...")
+        for progress in range(1, 51):
+            operation.update_progress(progress)
 
-        assert operation.status == "Processing files..."
+        assert emitted == [1]
 
-    def test_complete_success(self, qtbot):
-        """Test successful completion."""
-        operation = OperationProgress("test_op", "Test operation")
+        qtbot.waitUntil(lambda: emitted == [1, 50], timeout=1000)
 
-        with qtbot.waitSignal(operation.completed, timeout=1000) as blocker:
-            operation.complete_success("All done!")
+    def test_update_progress_same_value_not_reemitted(self, qtbot):
+        """Test an unchanged progress value does not emit again."""
+        operation = OperationProgress("test_op", "Test operation")
+        operation.update_progress(40)
+        qtbot.wait(50)
 
-        assert operation.is_completed
-        assert operation.progress == 100
-        assert operation.status == "All done!"
-        assert blocker.args == [True]  # Success signal
+        with qtbot.assertNotEmitted(operation.progress_changed, wait=50):
+            operation.update_progress(40)
 
-    def test_complete_error(self, qtbot):
-        """Test error completion."""
+    def test_update_status_only(self, qtbot):
+        """Test updating only status message."""
         operation = OperationProgress("test_op", "Test operation")
-        error = GitWorktreeManagerError("Something went wrong")
 
-        with qtbot.waitSignal(operation.completed, timeout=1000) as blocker:
-            operation.complete_error(error)
+        with qtbot.waitSignal(operation.status_changed, timeout=1000):
+            operation.update_status("Processing files...")
 
-        assert operation.is_completed
-        assert "Failed:" in operation.status
-        assert blocker.args == [False]  # Failure signal
+        assert operation.status == "Processing files..."
 
-    def test_cancel_operation(self, qtbot):
-        """Test cancelling an operation."""
+    @pytest.mark.parametrize(
+        "finish,success,status,cancelled",
+        [
+            (lambda op: op.complete_success("All done!"), True, "All done!", False),
+            (
+                lambda op: op.complete_error(
+                    GitWorktreeManagerError("Something went wrong")
+                ),
+                False,
+                "Failed:",
+                False,
+            ),
+            (lambda op: op.cancel(), False, "Cancelled", True),
+        ],
+        ids=["success", "error", "cancel"],
+    )
+    def test_completion(self, qtbot, finish, success, status, cancelled):
+        """Test success, error and cancel all complete the operation."""
         operation = OperationProgress("test_op", "Test operation")
 
-        with qtbot.waitSignal(operation.completed, timeout=1000) as blocker:
-            operation.cancel()
+        # Completion signals are emitted synchronously
+        with qtbot.waitSignal(operation.completed, timeout=200) as blocker:
+            finish(operation)
 
-        assert operation.is_cancelled
         assert operation.is_completed
-        assert operation.status == "Cancelled"
-        assert blocker.args == [False]  # Cancelled counts as failure
+        assert operation.is_cancelled is cancelled
+        assert status in operation.status
+        # Cancelled counts as failure
+        assert blocker.args == [success]
+        if success:
+            assert operation.progress == 100
 
 
 @pytest.fixture
@@ -162,6 +179,18 @@ class TestStatusBarManager:
         assert "❌" in status_bar.currentMessage()
         assert "Operation failed" in status_bar.currentMessage()
 
+    def test_message_burst_is_coalesced(self, status_bar, qtbot):
+        """Test rapid messages repaint once now and once with the latest text."""
+        manager = StatusBarManager(status_bar)
+        for i in range(10):
+            manager.show_message(f"Step {i}")
+
+        # The first message is shown immediately, the rest are coalesced
+        assert status_bar.currentMessage() == "Step 0"
+        assert manager._permanent_message == "Step 9"
+
+        qtbot.waitUntil(lambda: status_bar.currentMessage() == "Step 9", timeout=1000)
+
     def test_clear_message(self, status_bar):
         """Test clearing status bar message."""
         manager = StatusBarManager(status_bar)
@@ -187,7 +216,8 @@ class TestProgressManager:
     def test_progress_manager_creation(self, progress_manager):
         """Test creating a progress manager."""
         assert progress_manager.parent_widget is not None
-        assert len(progress_manager._operations) == 0
+        assert len(progress_manager._active_operations) == 0
+        assert len(progress_manager._completed_operations) == 0
 
     def test_start_operation(self, progress_manager, qtbot):
         """Test starting a new operation."""
@@ -198,7 +228,7 @@ class TestProgressManager:
 
         assert operation.operation_id == "test_op"
         assert operation.description == "Test operation"
-        assert "test_op" in progress_manager._operations
+        assert progress_manager.get_operation("test_op") is operation
 
     def test_get_operation(self, progress_manager):
         """Test getting an existing operation."""
@@ -218,9 +248,12 @@ class TestProgressManager:
             "test_op", "Test operation", show_dialog=False
         )
 
-        with qtbot.waitSignal(progress_manager.operation_completed, timeout=1000):
+        with qtbot.waitSignal(
+            progress_manager.operation_completed, timeout=1000
+        ) as blocker:
             progress_manager.complete_operation("test_op", True, "Success!")
 
+        assert blocker.args == ["test_op", True, operation]
         assert operation.is_completed
         assert operation.progress == 100
 
@@ -277,6 +310,27 @@ class TestProgressManager:
         assert "op3" in active
         assert "op2" not in active
 
+    def test_completed_operation_moves_out_of_active(self, progress_manager):
+        """Test completed operations stay retrievable but leave the active map."""
+        operation = progress_manager.start_operation(
+            "test_op", "Test operation", show_dialog=False
+        )
+        progress_manager.complete_operation("test_op", True)
+
+        assert "test_op" not in progress_manager._active_operations
+        assert progress_manager._completed_operations["test_op"] is operation
+        assert progress_manager.get_operation("test_op") is operation
+
+    def test_cancel_while_iterating_active_operations(self, progress_manager):
+        """Test active operations can be cancelled while iterating them."""
+        progress_manager.start_operation("op1", "Operation 1", show_dialog=False)
+        progress_manager.start_operation("op2", "Operation 2", show_dialog=False)
+
+        for operation_id in progress_manager.get_active_operations():
+            progress_manager.cancel_operation(operation_id)
+
+        assert len(progress_manager.get_active_operations()) == 0
+
     def test_cancel_all_operations(self, progress_manager):
         """Test cancelling all operations."""
         # Start multiple operations
@@ -289,6 +343,40 @@ class TestProgressManager:
         assert len(active) == 0
 
 
+class FakeProgressManager:
+    """Record calls made through the global progress manager helpers."""
+
+    def __init__(self):
+        self.calls = []
+        self.operation = object()
+
+    def start_operation(self, *args):
+        self.calls.append(("start_operation", *args))
+        return self.operation
+
+    def complete_operation(self, *args):
+        self.calls.append(("complete_operation", *args))
+
+    def update_operation_progress(self, *args):
+        self.calls.append(("update_operation_progress", *args))
+
+
+@pytest.fixture(scope="session")
+def fake_progress_manager():
+    """Create one FakeProgressManager shared by the whole session."""
+    return FakeProgressManager()
+
+
+@pytest.fixture
+def fake_global_manager(fake_progress_manager):
+    """Install the fake as the global progress manager for one test."""
+    previous = get_progress_manager()
+    fake_progress_manager.calls.clear()
+    set_progress_manager(fake_progress_manager)
+    yield fake_progress_manager
+    set_progress_manager(previous)
+
+
 class TestGlobalProgressManager:
     """Test global progress manager functions."""
 
@@ -307,34 +395,30 @@ class TestGlobalProgressManager:
         retrieved_manager = get_progress_manager()
         assert retrieved_manager is custom_manager
 
-    def test_global_start_operation(self):
+    def test_global_start_operation(self, fake_global_manager):
         """Test global start_operation function."""
-        with patch.object(get_progress_manager(), "start_operation") as mock_start:
-            mock_operation = Mock()
-            mock_start.return_value = mock_operation
-
-            result = start_operation("test_op", "Test operation")
+        result = start_operation("test_op", "Test operation")
 
-            assert result is mock_operation
-            mock_start.assert_called_once_with("test_op", "Test operation", True, True)
+        assert result is fake_global_manager.operation
+        assert fake_global_manager.calls == [
+            ("start_operation", "test_op", "Test operation", True, True)
+        ]
 
-    def test_global_complete_operation(self):
+    def test_global_complete_operation(self, fake_global_manager):
         """Test global complete_operation function."""
-        with patch.object(
-            get_progress_manager(), "complete_operation"
-        ) as mock_complete:
-            complete_operation("test_op", True, "Success")
+        complete_operation("test_op", True, "Success")
 
-            mock_complete.assert_called_once_with("test_op", True, "Success", None)
+        assert fake_global_manager.calls == [
+            ("complete_operation", "test_op", True, "Success", None)
+        ]
 
-    def test_global_update_progress(self):
+    def test_global_update_progress(self, fake_global_manager):
         """Test global update_operation_progress function."""
-        with patch.object(
-            get_progress_manager(), "update_operation_progress"
-        ) as mock_update:
-            update_operation_progress("test_op", 50, "Half done")
+        update_operation_progress("test_op", 50, "Half done")
 
-            mock_update.assert_called_once_with("test_op", 50, "Half done")
+        assert fake_global_manager.calls == [
+            ("update_operation_progress", "test_op", 50, "Half done")
+        ]
 
 
 class TestStatusIndicator:
@@ -361,22 +445,43 @@ class TestStatusIndicator:
             indicator.set_status(status)
             assert indicator._status == status
 
-    def test_animation_for_working_status(self, qtbot):
-        """Test that animation starts for working status."""
+    def test_pulse_for_working_status(self, qtbot):
+        """Test that the pulse starts for working status."""
         indicator = StatusIndicator()
         qtbot.addWidget(indicator)
 
         # Set to working status
         indicator.set_status("working")
 
-        # Animation should be running
-        assert indicator._animation.state() != indicator._animation.State.Stopped
+        # Pulse should be running
+        assert indicator._pulse_active
+        assert StatusIndicator._shared_timer.isActive()
 
         # Set to idle status
         indicator.set_status("idle")
 
-        # Animation should be stopped
-        assert indicator._animation.state() == indicator._animation.State.Stopped
+        # Pulse should be stopped
+        assert not indicator._pulse_active
+
+    def test_working_indicators_share_one_timer(self, qtbot):
+        """Test all working indicators pulse from a single shared timer."""
+        first = StatusIndicator()
+        second = StatusIndicator()
+        qtbot.addWidget(first)
+        qtbot.addWidget(second)
+
+        first.set_status("working")
+        second.set_status("working")
+
+        timer = StatusIndicator._shared_timer
+        assert timer is not None and timer.isActive()
+        qtbot.waitUntil(lambda: first._phase > 0 and second._phase > 0, timeout=1000)
+
+        first.set_status("success")
+        assert timer.isActive()
+
+        second.set_status("idle")
+        assert not timer.isActive()
 
 
 class TestOperationStatusWidget:
@@ -456,6 +561,23 @@ class TestOperationStatusPanel:
         # Should have operation widget
         assert "test_op" in panel._operation_widgets
 
+    def test_operation_widgets_inserted_in_one_batch(self, qtbot, progress_manager):
+        """Test widgets for several new operations are laid out together."""
+        panel = OperationStatusPanel(progress_manager)
+        qtbot.addWidget(panel)
+        initial_count = panel.operations_layout.count()
+
+        for i in range(3):
+            progress_manager.start_operation(f"op{i}", f"Op {i}", show_dialog=False)
+
+        # Widgets are tracked immediately but inserted on the next event loop pass
+        assert len(panel._operation_widgets) == 3
+        assert panel.operations_layout.count() == initial_count
+
+        qtbot.waitUntil(
+            lambda: panel.operations_layout.count() == initial_count + 3, timeout=1000
+        )
+
     def test_clear_completed_operations(self, qtbot, progress_manager):
         """Test clearing completed operations."""
         panel = OperationStatusPanel(progress_manager)
@@ -471,6 +593,16 @@ class TestOperationStatusPanel:
         # Widget should be removed
         assert "test_op" not in panel._operation_widgets
 
+    def test_deleted_widget_drops_out_of_panel(self, qtbot, progress_manager):
+        """Test a widget deleted outside the panel is no longer tracked."""
+        panel = OperationStatusPanel(progress_manager)
+        qtbot.addWidget(panel)
+        progress_manager.start_operation("test_op", "Test operation", show_dialog=False)
+        qtbot.waitUntil(lambda: not panel._pending_widgets, timeout=1000)
+
+        panel._operation_widgets["test_op"].deleteLater()
+        qtbot.waitUntil(lambda: "test_op" not in panel._operation_widgets, timeout=1000)
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
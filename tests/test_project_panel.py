@@ -1,15 +1,10 @@
 """Tests for project panel UI components."""
 
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
-from datetime import datetime
-from unittest.mock import patch
+from unittest.mock import call, patch
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox
-from PyQt6.QtTest import QTest
+from PyQt6.QtWidgets import QDialog, QDialogButtonBox, QMessageBox
 
 from wt_manager.ui.project_panel import (
     ProjectPanel,
@@ -18,24 +13,11 @@ from wt_manager.ui.project_panel import (
 )
 from wt_manager.ui.project_action_dialog import ProjectActionDialog
 from wt_manager.models.project import Project, ProjectStatus
+from conftest import FIXED_NOW
 
+OK_BUTTON = QDialogButtonBox.StandardButton.Ok
 
-@pytest.fixture
-def app():
-    """Create QApplication instance for testing."""
-    return QApplication.instance() or QApplication([])
-
-
-@pytest.fixture
-def temp_git_repo():
-    """Create a temporary Git repository for testing."""
-    temp_dir = tempfile.mkdtemp()
-    git_dir = Path(temp_dir) / ".git"
-    git_dir.mkdir()
-
-    # Create a basic git config
-    config_file = git_dir / "config"
-    config_file.write_text("""[core]
+GIT_CONFIG_BYTES = b"""[core]
     repositoryformatversion = 0
     filemode = true
     bare = false
@@ -43,139 +25,164 @@ def temp_git_repo():
 [remote "origin"]
     url = https://github.com/example/repo.git
     fetch = +refs/heads/*:refs/remotes/origin/*
-""")
-
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+"""
+
+# Constructor arguments for the sample projects; each test builds fresh
+# Project instances from them so mutations never leak between tests
+PROJECT_TEMPLATE = (
+    {
+        "id": "project1",
+        "name": "Test Project 1",
+        "path": "/path/to/project1",
+        "status": ProjectStatus.ACTIVE,
+        "last_accessed": FIXED_NOW,
+    },
+    {
+        "id": "project2",
+        "name": "Test Project 2",
+        "path": "/path/to/project2",
+        "status": ProjectStatus.ERROR,
+        "last_accessed": FIXED_NOW,
+    },
+    {
+        "id": "project3",
+        "name": "Test Project 3",
+        "path": "/path/to/project3",
+        "status": ProjectStatus.UNAVAILABLE,
+        "last_accessed": FIXED_NOW,
+    },
+)
 
 
 @pytest.fixture
-def temp_non_git_dir():
+def no_validation_delay(monkeypatch):
+    """Validate typed paths on the next event loop pass instead of after 500 ms."""
+    monkeypatch.setattr(AddProjectDialog, "VALIDATION_DELAY_MS", 0)
+
+
+@pytest.fixture(scope="session")
+def temp_git_repo(tmp_path_factory):
+    """Create a temporary Git repository for testing."""
+    temp_dir = tmp_path_factory.mktemp("gitrepo")
+    git_dir = temp_dir / ".git"
+    git_dir.mkdir()
+
+    # Create a basic git config
+    (git_dir / "config").write_bytes(GIT_CONFIG_BYTES)
+
+    return str(temp_dir)
+
+
+@pytest.fixture(scope="session")
+def temp_non_git_dir(tmp_path_factory):
     """Create a temporary non-Git directory for testing."""
-    temp_dir = tempfile.mkdtemp()
-    yield temp_dir
-    shutil.rmtree(temp_dir)
+    return str(tmp_path_factory.mktemp("nongit"))
 
 
 @pytest.fixture
 def sample_projects():
     """Create sample projects for testing."""
-    return [
-        Project(
-            id="project1",
-            name="Test Project 1",
-            path="/path/to/project1",
-            status=ProjectStatus.ACTIVE,
-            last_accessed=datetime.now(),
-        ),
-        Project(
-            id="project2",
-            name="Test Project 2",
-            path="/path/to/project2",
-            status=ProjectStatus.ERROR,
-            last_accessed=datetime.now(),
-        ),
-        Project(
-            id="project3",
-            name="Test Project 3",
-            path="/path/to/project3",
-            status=ProjectStatus.UNAVAILABLE,
-            last_accessed=datetime.now(),
-        ),
-    ]
+    return [Project(**fields) for fields in PROJECT_TEMPLATE]
+
+
+@pytest.fixture
+def populated_panel(qapp, sample_projects):
+    """Create a ProjectPanel populated with the sample projects."""
+    panel = ProjectPanel()
+    panel.populate_projects(sample_projects)
+    return panel
+
+
+@pytest.fixture(scope="class")
+def shared_panel(qapp):
+    """Create one populated ProjectPanel shared by a class's read-only tests."""
+    panel = ProjectPanel()
+    panel.populate_projects([Project(**fields) for fields in PROJECT_TEMPLATE])
+    yield panel
+    panel.deleteLater()
 
 
 class TestAddProjectDialog:
     """Test cases for AddProjectDialog."""
 
-    def test_dialog_initialization(self, app):
+    def test_dialog_initialization(self, qtbot):
         """Test dialog initializes correctly."""
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
         assert dialog.windowTitle() == "Add Project"
         assert dialog.isModal()
-        assert not dialog.button_box.button(
-            dialog.button_box.StandardButton.Ok
-        ).isEnabled()
+        assert not dialog.button_box.button(OK_BUTTON).isEnabled()
 
-    def test_browse_button_functionality(self, app, temp_git_repo):
+    def test_browse_button_functionality(self, qtbot, temp_git_repo):
         """Test browse button opens file dialog."""
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
         # Mock the file dialog to return our temp directory
         with patch("PyQt6.QtWidgets.QFileDialog.getExistingDirectory") as mock_dialog:
             mock_dialog.return_value = temp_git_repo
 
             # Click browse button
-            QTest.mouseClick(dialog.browse_btn, Qt.MouseButton.LeftButton)
+            dialog.browse_btn.click()
 
             # Check that path was set
             assert dialog.path_edit.text() == temp_git_repo
 
-    def test_path_validation_valid_repo(self, app, temp_git_repo):
-        """Test path validation with valid Git repository."""
-        dialog = AddProjectDialog()
-
-        # Set valid Git repository path
-        dialog.path_edit.setText(temp_git_repo)
-
-        # Wait for validation timer
-        QTest.qWait(600)
-
-        # Check validation passed
-        assert dialog.button_box.button(dialog.button_box.StandardButton.Ok).isEnabled()
-        assert "Valid Git repository" in dialog.validation_status.text()
-        # Note: path_info_group visibility may depend on validation timing
-
-    def test_path_validation_non_existent_path(self, app):
-        """Test path validation with non-existent path."""
+    @pytest.mark.parametrize(
+        ("path_fixture", "expected", "accepted"),
+        [
+            ("temp_git_repo", "Valid Git repository", True),
+            (None, "does not exist", False),
+            ("temp_non_git_dir", "not a Git repository", False),
+        ],
+        ids=["valid_repo", "non_existent_path", "non_git_directory"],
+    )
+    def test_path_validation(
+        self, qtbot, request, no_validation_delay, path_fixture, expected, accepted
+    ):
+        """Test path validation for valid, missing and non-Git paths."""
+        path = (
+            request.getfixturevalue(path_fixture)
+            if path_fixture
+            else "/non/existent/path"
+        )
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
-        # Set non-existent path
-        dialog.path_edit.setText("/non/existent/path")
+        dialog.path_edit.setText(path)
 
-        # Wait for validation timer
-        QTest.qWait(600)
+        # Wait for validation to finish
+        qtbot.waitUntil(
+            lambda: expected in dialog.validation_status.text(), timeout=1500
+        )
 
-        # Check validation failed
-        assert not dialog.button_box.button(
-            dialog.button_box.StandardButton.Ok
-        ).isEnabled()
-        assert "does not exist" in dialog.validation_status.text()
-
-    def test_path_validation_non_git_directory(self, app, temp_non_git_dir):
-        """Test path validation with non-Git directory."""
-        dialog = AddProjectDialog()
+        ok_button = dialog.button_box.button(OK_BUTTON)
+        assert ok_button.isEnabled() is accepted
+        assert expected in dialog.validation_status.text()
 
-        # Set non-Git directory path
-        dialog.path_edit.setText(temp_non_git_dir)
-
-        # Wait for validation timer
-        QTest.qWait(600)
-
-        # Check validation failed
-        assert not dialog.button_box.button(
-            dialog.button_box.StandardButton.Ok
-        ).isEnabled()
-        assert "not a Git repository" in dialog.validation_status.text()
-
-    def test_auto_fill_project_name(self, app, temp_git_repo):
+    def test_auto_fill_project_name(self, qtbot, no_validation_delay, temp_git_repo):
         """Test automatic project name filling."""
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
         # Set valid Git repository path
         dialog.path_edit.setText(temp_git_repo)
 
-        # Wait for validation timer
-        QTest.qWait(600)
+        # Wait for validation to finish
+        qtbot.waitUntil(
+            lambda: "Valid Git repository" in dialog.validation_status.text(),
+            timeout=1500,
+        )
 
         # Check project name was auto-filled
         expected_name = Path(temp_git_repo).name
         assert dialog.name_edit.text() == expected_name
 
-    def test_get_project_data(self, app, temp_git_repo):
+    def test_get_project_data(self, qtbot, temp_git_repo):
         """Test getting project data from dialog."""
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
         dialog.path_edit.setText(temp_git_repo)
         dialog.name_edit.setText("Custom Name")
@@ -185,22 +192,21 @@ class TestAddProjectDialog:
         assert data["path"] == temp_git_repo
         assert data["name"] == "Custom Name"
 
-    def test_external_validation_error(self, app):
+    def test_external_validation_error(self, qtbot):
         """Test showing external validation error."""
         dialog = AddProjectDialog()
+        qtbot.addWidget(dialog)
 
         dialog.show_external_validation_error("External validation failed")
 
         assert "External validation failed" in dialog.validation_status.text()
-        assert not dialog.button_box.button(
-            dialog.button_box.StandardButton.Ok
-        ).isEnabled()
+        assert not dialog.button_box.button(OK_BUTTON).isEnabled()
 
 
 class TestProjectHealthDialog:
     """Test cases for ProjectHealthDialog."""
 
-    def test_dialog_initialization(self, app, sample_projects):
+    def test_dialog_initialization(self, qtbot, sample_projects):
         """Test health dialog initializes correctly."""
         project = sample_projects[0]
         health_data = {
@@ -213,11 +219,12 @@ class TestProjectHealthDialog:
         }
 
         dialog = ProjectHealthDialog(project, health_data)
+        qtbot.addWidget(dialog)
 
         assert f"Project Health - {project.get_display_name()}" in dialog.windowTitle()
         assert dialog.isModal()
 
-    def test_health_status_display_healthy(self, app, sample_projects):
+    def test_health_status_display_healthy(self, qtbot, sample_projects):
         """Test display of healthy project status."""
         project = sample_projects[0]
         health_data = {
@@ -229,12 +236,13 @@ class TestProjectHealthDialog:
             "last_checked": "2024-01-01T12:00:00",
         }
 
-        ProjectHealthDialog(project, health_data)
+        dialog = ProjectHealthDialog(project, health_data)
+        qtbot.addWidget(dialog)
 
         # Check that health status is displayed correctly
         # This is a basic check - in a real test, we'd verify the UI elements more thoroughly
 
-    def test_health_status_display_with_issues(self, app, sample_projects):
+    def test_health_status_display_with_issues(self, qtbot, sample_projects):
         """Test display of project with issues."""
         project = sample_projects[1]  # ERROR status project
         health_data = {
@@ -247,6 +255,7 @@ class TestProjectHealthDialog:
         }
 
         dialog = ProjectHealthDialog(project, health_data)
+        qtbot.addWidget(dialog)
 
         # Verify dialog was created successfully
         assert dialog is not None
@@ -255,7 +264,7 @@ class TestProjectHealthDialog:
 class TestProjectPanel:
     """Test cases for ProjectPanel."""
 
-    def test_panel_initialization(self, app):
+    def test_panel_initialization(self, qapp):
         """Test panel initializes correctly."""
         panel = ProjectPanel()
 
@@ -265,7 +274,7 @@ class TestProjectPanel:
         assert panel.remove_btn.text() == "Remove"
         assert not panel.remove_btn.isEnabled()
 
-    def test_populate_projects(self, app, sample_projects):
+    def test_populate_projects(self, qapp, sample_projects):
         """Test populating projects in the panel."""
         panel = ProjectPanel()
 
@@ -277,49 +286,45 @@ class TestProjectPanel:
         # Check that projects are stored internally
         assert len(panel._projects) == len(sample_projects)
 
-    def test_project_selection(self, app, sample_projects):
+    def test_project_selection(self, populated_panel):
         """Test project selection functionality."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Mock signal emission
-        with patch.object(panel, "project_selected") as mock_signal:
+        with patch.object(populated_panel, "project_selected") as mock_signal:
             # Select first project
-            panel.project_list.setCurrentRow(0)
+            populated_panel.project_list.setCurrentRow(0)
 
             # Trigger selection change
-            panel._on_selection_changed()
+            populated_panel._on_selection_changed()
 
             # Check that signal was emitted and remove button enabled
             assert mock_signal.emit.called
-            assert panel.remove_btn.isEnabled()
+            assert populated_panel.remove_btn.isEnabled()
 
-    def test_add_project_dialog_opening(self, app):
+    def test_add_project_dialog_opening(self, qapp):
         """Test opening add project dialog."""
         panel = ProjectPanel()
 
         # Test that clicking the button triggers the correct method
         with patch.object(AddProjectDialog, "exec") as mock_dialog:
             mock_dialog.return_value = QDialog.DialogCode.Rejected
-            QTest.mouseClick(panel.add_btn, Qt.MouseButton.LeftButton)
+            panel.add_btn.click()
             # The dialog should have been created and shown
             mock_dialog.assert_called_once()
 
-    def test_remove_project_confirmation(self, app, sample_projects):
+    def test_remove_project_confirmation(self, populated_panel, sample_projects):
         """Test remove project confirmation dialog."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Select a project
-        panel.project_list.setCurrentRow(0)
-        panel._on_selection_changed()
+        populated_panel.project_list.setCurrentRow(0)
+        populated_panel._on_selection_changed()
 
         # Mock message box
         with patch("PyQt6.QtWidgets.QMessageBox.question") as mock_msgbox:
             mock_msgbox.return_value = QMessageBox.StandardButton.Yes
 
-            with patch.object(panel, "remove_project_requested") as mock_signal:
-                panel._on_remove_project()
+            with patch.object(
+                populated_panel, "remove_project_requested"
+            ) as mock_signal:
+                populated_panel._on_remove_project()
 
                 # Check that confirmation was shown
                 mock_msgbox.assert_called_once()
@@ -327,31 +332,25 @@ class TestProjectPanel:
                 # Check that signal was emitted
                 mock_signal.emit.assert_called_once_with(sample_projects[0].id)
 
-    def test_context_menu_display(self, app, sample_projects):
+    def test_context_menu_display(self, shared_panel):
         """Test context menu display on right-click."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Get first item position
-        item = panel.project_list.item(0)
-        rect = panel.project_list.visualItemRect(item)
+        item = shared_panel.project_list.item(0)
+        rect = shared_panel.project_list.visualItemRect(item)
         position = rect.center()
 
         # Mock menu execution
         with patch("PyQt6.QtWidgets.QMenu.exec") as mock_menu:
-            panel._show_context_menu(position)
+            shared_panel._show_context_menu(position)
 
             # Check that menu was shown
             mock_menu.assert_called_once()
 
-    def test_project_status_indicators(self, app, sample_projects):
+    def test_project_status_indicators(self, shared_panel):
         """Test project status indicators display."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Check that status icons are displayed
-        for i, project in enumerate(sample_projects):
-            item = panel.project_list.item(i)
+        for i, project in enumerate(shared_panel._projects.values()):
+            item = shared_panel.project_list.item(i)
             text = item.text()
 
             # Check that status icon is present
@@ -362,43 +361,34 @@ class TestProjectPanel:
             elif project.status == ProjectStatus.UNAVAILABLE:
                 assert "⚠" in text
 
-    def test_refresh_project_item(self, app, sample_projects):
+    def test_refresh_project_item(self, populated_panel, sample_projects):
         """Test refreshing individual project item."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Modify project status
         updated_project = sample_projects[0]
         updated_project.status = ProjectStatus.ERROR
         updated_project.name = "Updated Name"
 
         # Refresh the item
-        panel.refresh_project_item(updated_project)
+        populated_panel.refresh_project_item(updated_project)
 
         # Check that item was updated
-        item = panel.project_list.item(0)
+        item = populated_panel.project_list.item(0)
         assert "Updated Name" in item.text()
         assert "✗" in item.text()  # Error status icon
 
-    def test_clear_projects(self, app, sample_projects):
+    def test_clear_projects(self, populated_panel):
         """Test clearing all projects."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         # Clear projects
-        panel.clear_projects()
+        populated_panel.clear_projects()
 
         # Check that list is empty
-        assert panel.project_list.count() == 0
-        assert len(panel._projects) == 0
-        assert panel._current_project_id is None
-        assert not panel.remove_btn.isEnabled()
+        assert populated_panel.project_list.count() == 0
+        assert len(populated_panel._projects) == 0
+        assert populated_panel._current_project_id is None
+        assert not populated_panel.remove_btn.isEnabled()
 
-    def test_project_health_display(self, app, sample_projects):
+    def test_project_health_display(self, populated_panel, sample_projects):
         """Test project health dialog display."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
         health_data = {
             "overall_status": "healthy",
             "branch_count": 5,
@@ -410,81 +400,65 @@ class TestProjectPanel:
 
         # Mock dialog execution
         with patch.object(ProjectActionDialog, "exec") as mock_exec:
-            panel.show_project_health(sample_projects[0].id, health_data)
+            populated_panel.show_project_health(sample_projects[0].id, health_data)
             mock_exec.assert_called_once()
 
-    def test_error_message_display(self, app):
+    def test_error_message_display(self, qapp):
         """Test error message display methods."""
         from wt_manager.services.message_service import get_message_service
-        from unittest.mock import patch
 
         panel = ProjectPanel()
+        service = get_message_service()
 
-        # Test validation error
-        with patch.object(get_message_service(), "show_error") as mock_show_error:
+        with patch.object(service, "show_error") as mock_show_error:
             panel.show_validation_error("Test validation error")
-            mock_show_error.assert_called_once_with(
-                "Validation Error", "Test validation error"
-            )
-
-        # Test operation error
-        with patch.object(get_message_service(), "show_error") as mock_show_error:
             panel.show_operation_error("Test Title", "Test operation error")
-            mock_show_error.assert_called_once_with(
-                "Test Title", "Test operation error"
-            )
 
-    def test_open_in_file_manager(self, app, sample_projects):
-        """Test opening project in file manager."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
+        assert mock_show_error.call_args_list == [
+            call("Validation Error", "Test validation error"),
+            call("Test Title", "Test operation error"),
+        ]
 
+    def test_open_in_file_manager(self, populated_panel, sample_projects):
+        """Test opening project in file manager."""
         # Mock subprocess call
-        with patch("subprocess.run") as mock_subprocess:
-            panel._open_in_file_manager(sample_projects[0].path)
+        with patch("wt_manager.ui.project_panel.subprocess.run") as mock_subprocess:
+            populated_panel._open_in_file_manager(sample_projects[0].path)
             mock_subprocess.assert_called_once()
 
-    def test_double_click_health_check(self, app, sample_projects):
+    def test_double_click_health_check(self, populated_panel, sample_projects):
         """Test double-click triggers health check."""
-        panel = ProjectPanel()
-        panel.populate_projects(sample_projects)
-
-        with patch.object(panel, "project_health_requested") as mock_signal:
-            item = panel.project_list.item(0)
-            panel._on_item_double_clicked(item)
+        with patch.object(populated_panel, "project_health_requested") as mock_signal:
+            item = populated_panel.project_list.item(0)
+            populated_panel._on_item_double_clicked(item)
 
             mock_signal.emit.assert_called_once_with(sample_projects[0].id)
 
-    def test_signal_emissions(self, app, sample_projects):
-        """Test that all required signals are emitted correctly."""
+    def test_refresh_signal(self, qtbot):
+        """Test the refresh button emits refresh_projects_requested."""
         panel = ProjectPanel()
 
-        # Test refresh signal connection
-        signal_emitted = False
-
-        def on_refresh():
-            nonlocal signal_emitted
-            signal_emitted = True
-
-        panel.refresh_projects_requested.connect(on_refresh)
-        panel.refresh_btn.clicked.emit()
-        assert signal_emitted
+        with qtbot.waitSignal(panel.refresh_projects_requested, timeout=100):
+            panel.refresh_btn.clicked.emit()
 
-        # Test add project signal
-        with patch.object(AddProjectDialog, "exec") as mock_dialog:
-            mock_dialog.return_value = QDialog.DialogCode.Accepted
-            with patch.object(AddProjectDialog, "get_project_data") as mock_data:
-                mock_data.return_value = {"path": "/test/path", "name": "Test"}
-
-                add_signal_emitted = False
-
-                def on_add_project(path, name):
-                    nonlocal add_signal_emitted
-                    add_signal_emitted = True
+    def test_add_project_signal(self, qtbot):
+        """Test an accepted add dialog emits add_project_requested."""
+        panel = ProjectPanel()
 
-                panel.add_project_requested.connect(on_add_project)
-                panel._on_add_project()
-                assert add_signal_emitted
+        with (
+            patch.object(
+                AddProjectDialog, "exec", return_value=QDialog.DialogCode.Accepted
+            ),
+            patch.object(
+                AddProjectDialog,
+                "get_project_data",
+                return_value={"path": "/test/path", "name": "Test"},
+            ),
+            qtbot.waitSignal(panel.add_project_requested, timeout=100) as blocker,
+        ):
+            panel._on_add_project()
+
+        assert blocker.args == ["/test/path", "Test"]
 
 
 if __name__ == "__main__":
@@ -9,6 +9,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from wt_manager.models.project import Project, ProjectStatus
+from wt_manager.models.worktree import normalize_path
 from wt_manager.services.project_service import ProjectService
 from wt_manager.utils.exceptions import ServiceError, ValidationError
 
@@ -204,6 +205,35 @@ class TestProjectService:
         assert refreshed_project.id == project_id
         self.mock_config_manager.update_project.assert_called_once()
 
+    def test_refresh_project_forgets_resolved_paths(self, tmp_path):
+        """Test refreshing a project re-resolves retargeted symlinks."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(first)
+        assert normalize_path(str(link)) == str(first.resolve())
+        link.unlink()
+        link.symlink_to(second)
+
+        project_id = "test-id"
+        project = Project(
+            id=project_id,
+            name="test",
+            path="/test/path",
+            status=ProjectStatus.ACTIVE,
+            last_accessed=datetime.now(),
+        )
+        self.mock_config_manager.get_all_project_configs.return_value = []
+        self.service.initialize()
+        self.service._projects_cache[project_id] = project
+        self.mock_config_manager.update_project.return_value = True
+
+        self.service.refresh_project(project_id)
+
+        assert normalize_path(str(link)) == str(second.resolve())
+
     def test_refresh_project_not_found(self):
         """Test refreshing non-existent project."""
         # Mock config loading for initialization
@@ -8,7 +8,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 from wt_manager.models.project import Project, ProjectStatus
-from wt_manager.models.worktree import Worktree
+from wt_manager.models.worktree import Worktree, normalize_path
 from wt_manager.services.worktree_service import WorktreeService
 from wt_manager.utils.exceptions import ServiceError, ValidationError
 
@@ -308,6 +308,24 @@ class TestWorktreeService:
             "branch-name", "/test/project", self.mock_git_service
         )
 
+    def test_refresh_worktrees_forgets_resolved_paths(self, tmp_path):
+        """Test refreshing worktrees re-resolves retargeted symlinks."""
+        first = tmp_path / "first"
+        second = tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(first)
+        assert normalize_path(str(link)) == str(first.resolve())
+        link.unlink()
+        link.symlink_to(second)
+
+        project = Mock(spec=Project)
+        with patch.object(self.service, "get_worktrees", return_value=[]):
+            self.service.refresh_worktrees(project)
+
+        assert normalize_path(str(link)) == str(second.resolve())
+
     def test_refresh_worktree(self):
         """Test worktree refresh."""
         # Setup